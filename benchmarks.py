@@ -0,0 +1,440 @@
+#! /usr/bin/env python
+"""
+Rough timings for the serializer hot paths.
+
+    ./benchmarks.py              # Run every benchmark.
+    ./benchmarks.py serialize    # Run the named benchmarks only.
+"""
+from core_serializers import fields, serializers
+from core_serializers.utils import (
+    BasicObject, get_html_view, parse_html_dict, set_value
+)
+from collections import OrderedDict
+import re
+import sys
+import timeit
+
+
+BENCHMARKS = OrderedDict()
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def report(label, seconds, rows):
+    print('  %-32s %8.3fs %10.0f rows/s' % (label, seconds, rows / seconds))
+
+
+def best_of(func, repeat=3):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+class Child(serializers.Serializer):
+    name = fields.CharField()
+    score = fields.IntegerField()
+
+
+class Row(serializers.Serializer):
+    id = fields.IntegerField()
+    title = fields.CharField()
+    active = fields.BooleanField()
+    owner = fields.CharField(source='owner.name')
+    child = Child()
+
+
+class RowList(serializers.ListSerializer):
+    child = Row()
+
+
+def make_rows(count):
+    owner = BasicObject(name='owner')
+    return [
+        BasicObject(
+            id=idx, title='row %d' % idx, active=bool(idx % 2), owner=owner,
+            child=BasicObject(name='child', score=idx)
+        )
+        for idx in range(count)
+    ]
+
+
+def interpreted_to_primative(serializer, instance):
+    """
+    The per-field dispatch used by `Serializer.to_primative` before
+    serialization plans were compiled.
+    """
+    ret = OrderedDict()
+    fields = [field for field in serializer.fields.values() if not field.write_only]
+    for field in fields:
+        native_value = field.get_attribute(instance)
+        if isinstance(field, serializers.Serializer):
+            ret[field.field_name] = interpreted_to_primative(field, native_value)
+        else:
+            ret[field.field_name] = field.to_primative(native_value)
+    return ret
+
+
+def interpreted_to_native(serializer, data):
+    """
+    The per-field dispatch used by `Serializer.to_native` before
+    validation plans were compiled.
+    """
+    ret = {}
+    errors = {}
+    fields = [field for field in serializer.fields.values() if not field.read_only]
+    for field in fields:
+        primitive_value = field.get_value(data)
+        try:
+            if isinstance(field, serializers.Serializer):
+                validated_value = interpreted_to_native(field, primitive_value)
+            else:
+                validated_value = field.validate(primitive_value)
+        except serializers.ValidationError as exc:
+            errors[field.field_name] = str(exc)
+        except serializers.SkipField:
+            pass
+        else:
+            set_value(ret, field.source_attrs, validated_value)
+    if errors:
+        raise serializers.ValidationError(errors)
+    return ret
+
+
+@benchmark
+def serialize(count=100000):
+    rows = make_rows(count)
+    serializer = Row()
+    assert [interpreted_to_primative(serializer, row) for row in rows[:10]] == \
+        [serializer.to_primative(row) for row in rows[:10]]
+
+    print('serialize: %d rows' % count)
+    report('interpreted', best_of(lambda: [
+        interpreted_to_primative(serializer, row) for row in rows
+    ]), count)
+    report('compiled plan', best_of(lambda: [
+        serializer.to_primative(row) for row in rows
+    ]), count)
+
+
+@benchmark
+def columnar(count=50000):
+    rows = make_rows(count)
+    serializer = Row()
+    assert serializer.to_primative_many(rows[:10]) == \
+        [serializer.to_primative(row) for row in rows[:10]]
+
+    print('columnar: %d rows' % count)
+    report('row at a time', best_of(lambda: [
+        serializer.to_primative(row) for row in rows
+    ]), count)
+    report('column at a time', best_of(lambda: serializer.to_primative_many(rows)), count)
+    report('columns only', best_of(lambda: serializer.to_columns(rows)), count)
+
+
+@benchmark
+def validate(count=100000):
+    payloads = [
+        {
+            'id': str(idx), 'title': 'row %d' % idx, 'active': 'true',
+            'owner': 'owner', 'child': {'name': 'child', 'score': idx}
+        }
+        for idx in range(count)
+    ]
+    serializer = Row()
+    assert [interpreted_to_native(serializer, data) for data in payloads[:10]] == \
+        [serializer.to_native(data) for data in payloads[:10]]
+
+    print('validate: %d payloads' % count)
+    report('interpreted', best_of(lambda: [
+        interpreted_to_native(serializer, data) for data in payloads
+    ]), count)
+    report('compiled plan', best_of(lambda: [
+        serializer.to_native(data) for data in payloads
+    ]), count)
+
+
+@benchmark
+def construct(count=100000):
+    def copied():
+        serializer = Row()
+        serializer.fields['id']
+        return serializer
+
+    print('construct: %d serializers' % count)
+    report('copied fields', best_of(lambda: [
+        copied() for idx in range(count // 10)
+    ]), count // 10)
+    report('unused fields', best_of(lambda: [
+        Row() for idx in range(count)
+    ]), count)
+    row = make_rows(1)[0]
+    report('serialize one row', best_of(lambda: [
+        Row(row).data for idx in range(count)
+    ]), count)
+
+
+@benchmark
+def parallel(counts=(10000, 100000, 1000000), workers=4, chunk_size=5000):
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    for count in counts:
+        rows = make_rows(count)
+        repeat = 3 if count < 1000000 else 1
+        print('parallel: %d rows, %d workers' % (count, workers))
+        report('serial', best_of(lambda: RowList(rows).data, repeat), count)
+        for label, executor_class in (
+            ('threads', ThreadPoolExecutor),
+            ('processes', ProcessPoolExecutor)
+        ):
+            with executor_class(workers) as executor:
+                def run():
+                    return RowList(rows, executor=executor, chunk_size=chunk_size).data
+                report(label, best_of(run, repeat), count)
+
+
+class FormattedMethodField(fields.MethodField):
+    """
+    A method field that looks up its method for every value, as
+    `MethodField` did before the method was resolved when binding.
+    """
+
+    def to_primative(self, value):
+        attr = 'get_{field_name}'.format(field_name=self.field_name)
+        method = getattr(self.parent, attr)
+        return method(value)
+
+
+@benchmark
+def method_fields(count=100000):
+    class Lookup(serializers.Serializer):
+        id = fields.IntegerField()
+        label = fields.MethodField()
+        code = fields.MethodField()
+
+        def get_label(self, instance):
+            return instance.title
+
+        def get_code(self, instance):
+            return instance.id
+
+    class FormattedLookup(Lookup):
+        label = FormattedMethodField()
+        code = FormattedMethodField()
+
+    rows = make_rows(count)
+    print('method_fields: %d rows' % count)
+    for label, serializer in (
+        ('looked up per value', FormattedLookup()),
+        ('bound method', Lookup())
+    ):
+        report(label + ', per row', best_of(lambda: [
+            serializer.to_primative(row) for row in rows
+        ]), count)
+        report(label + ', list', best_of(lambda: serializer.to_primative_many(rows)), count)
+
+
+@benchmark
+def forms(count=1000, field_count=200):
+    from core_serializers import renderers
+
+    Form = type('Form', (serializers.Serializer,), dict(
+        ('field_%d' % idx, fields.CharField(label='Field %d' % idx))
+        for idx in range(field_count)
+    ))
+    renderer = renderers.FormRenderer()
+    template = renderers.get_template(renderer.template_name)
+
+    print('forms: %d forms, %d fields' % (count, field_count))
+    report('template per field', best_of(lambda: [
+        template.render(form=Form(), renderer=renderer, layout='vertical')
+        for idx in range(count)
+    ]), count)
+    report('compiled form', best_of(lambda: [
+        renderer.render(Form()) for idx in range(count)
+    ]), count)
+
+
+@benchmark
+def scalar_lists(count=1000000):
+    print('scalar_lists: %d items' % count)
+    for label, child, data in (
+        ('strings', fields.CharField(), ['item %d' % idx for idx in range(count)]),
+        ('integers', fields.IntegerField(), list(range(count))),
+        ('integer strings', fields.IntegerField(), [str(idx) for idx in range(count)]),
+    ):
+        serializer = serializers.ListSerializer(child=child)
+        assert serializer.to_native(data[:10]) == [child.validate(item) for item in data[:10]]
+        report(label + ', per item', best_of(lambda: [
+            child.validate(item) for item in data
+        ]), count)
+        report(label + ', whole list', best_of(lambda: serializer.to_native(data)), count)
+
+
+@benchmark
+def json_backends(count=100000):
+    from core_serializers import renderers
+
+    data = RowList(make_rows(count)).data
+    print('json_backends: %d rows' % count)
+    for name in renderers.json_backends.keys():
+        renderer = renderers.JSONRenderer(backend=name)
+        report(name, best_of(lambda: renderer.render(data)), count)
+
+
+@benchmark
+def direct_json(count=100000):
+    from core_serializers import renderers
+
+    rows = make_rows(count)
+    renderer = renderers.JSONRenderer()
+    assert renderer.render_serializer(RowList(rows[:10])) == renderer.render(RowList(rows[:10]).data)
+
+    print('direct_json: %d rows' % count)
+    report('serialize, then render', best_of(lambda: renderer.render(RowList(rows).data)), count)
+    report('encode directly', best_of(lambda: renderer.render_serializer(RowList(rows))), count)
+
+
+@benchmark
+def binary_formats(count=20000):
+    from core_serializers import parsers, renderers
+
+    data = RowList(make_rows(count)).data
+    print('binary_formats: %d rows' % count)
+    for label, renderer, parser in (
+        ('json', renderers.JSONRenderer(), parsers.JSONParser()),
+        ('msgpack', renderers.MsgPackRenderer(), parsers.MsgPackParser()),
+        ('cbor', renderers.CBORRenderer(), parsers.CBORParser()),
+    ):
+        output = renderer.render(data)
+        accelerated = getattr(renderer, 'accelerated', False)
+        print('  %s: %d bytes%s' % (label, len(output), ', accelerated' if accelerated else ''))
+        report(label + ', render', best_of(lambda: renderer.render(data)), count)
+        report(label + ', parse', best_of(lambda: parser.parse(output)), count)
+
+
+@benchmark
+def columnar_export(count=100000):
+    from core_serializers import renderers
+
+    rows = make_rows(count)
+    renderer = renderers.ColumnarRenderer()
+    child = RowList().child
+
+    print('columnar_export: %d rows' % count)
+    report('rows', best_of(lambda: RowList(rows).data), count)
+    report('typed columns', best_of(lambda: renderer.get_columns(child, rows)), count)
+
+
+@benchmark
+def csv_export(count=100000):
+    from core_serializers import renderers
+    import csv
+    import io
+
+    def from_data():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in RowList(rows).data:
+            child = row.pop('child')
+            writer.writerow(list(row.values()) + list(child.values()))
+        return buffer.getvalue()
+
+    rows = make_rows(count)
+    renderer = renderers.CSVRenderer()
+    print('csv_export: %d rows' % count)
+    report('from list serializer data', best_of(from_data), count)
+    report('streamed', best_of(lambda: list(renderer.render_iter(Row, rows))), count)
+
+
+class StringChoiceField(fields.ChoiceField):
+    """
+    A choice field that converts every input to a string before looking it
+    up, as `ChoiceField` did before it tried a direct lookup first.
+    """
+
+    def to_native(self, data):
+        try:
+            return self.choice_strings_to_values[str(data)]
+        except KeyError:
+            self.fail('invalid_choice', input=data)
+
+
+class StringMultipleChoiceField(fields.MultipleChoiceField):
+    """
+    A multiple choice field that looks up each item as a string, as
+    `MultipleChoiceField` did before it validated items as a set.
+    """
+
+    def to_native(self, data):
+        return set([StringChoiceField.to_native(self, item) for item in data])
+
+
+@benchmark
+def choices(count=100000, choice_count=5000, selected_count=500):
+    codes = ['code-%d' % idx for idx in range(choice_count)]
+    inputs = [codes[idx % choice_count] for idx in range(count)]
+    numbers = [idx % choice_count for idx in range(count)]
+    selected = codes[::choice_count // selected_count]
+
+    print('choices: %d choices' % choice_count)
+    for label, field, items in (
+        ('string lookup', StringChoiceField(choices=codes), inputs),
+        ('direct lookup', fields.ChoiceField(choices=codes), inputs),
+        ('integers, string lookup', StringChoiceField(choices=range(choice_count)), numbers),
+        ('integers, direct lookup', fields.ChoiceField(choices=range(choice_count)), numbers)
+    ):
+        report(label, best_of(lambda: [field.to_native(item) for item in items]), count)
+    for label, field in (
+        ('multiple, per item', StringMultipleChoiceField(choices=codes)),
+        ('multiple, as a set', fields.MultipleChoiceField(choices=codes))
+    ):
+        assert field.to_native(selected) == set(selected)
+        report(label, best_of(lambda: [
+            field.to_native(selected) for idx in range(count // selected_count)
+        ]), count)
+
+
+def scanned_parse_html_dict(dictionary, prefix):
+    """
+    `parse_html_dict` as it was before MultiDict keys were indexed, scanning
+    every key with a new regex on every call.
+    """
+    ret = {}
+    regex = re.compile(r'^%s\.(.+)$' % re.escape(prefix))
+    for field, value in dictionary.items():
+        match = regex.match(field)
+        if match:
+            ret[match.groups()[0]] = value
+    return ret
+
+
+@benchmark
+def html_forms(count=100, nested_count=500):
+    from werkzeug.datastructures import MultiDict
+
+    prefixes = ['nested_%d' % idx for idx in range(nested_count)]
+    items = [
+        (prefix + '.' + key, 'value')
+        for prefix in prefixes for key in ('name', 'email', 'city')
+    ]
+    data = MultiDict(items)
+    assert [scanned_parse_html_dict(data, prefix) for prefix in prefixes] == \
+        [parse_html_dict(get_html_view(data), prefix) for prefix in prefixes]
+
+    # A whole form is parsed through one view, as by `Serializer.to_native`.
+    print('html_forms: %d forms, %d keys' % (count, len(items)))
+    report('scan per field', best_of(lambda: [
+        [scanned_parse_html_dict(form, prefix) for prefix in prefixes]
+        for form in [MultiDict(items) for idx in range(count)]
+    ]), count)
+    report('prefix index', best_of(lambda: [
+        [parse_html_dict(view, prefix) for prefix in prefixes]
+        for view in [get_html_view(MultiDict(items)) for idx in range(count)]
+    ]), count)
+
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS.keys())
+    for name in names:
+        BENCHMARKS[name]()
@@ -0,0 +1,183 @@
+"""
+Asynchronous serialization, for use with `asyncio`.
+
+Attribute values and `get_<field_name>` method results may be awaitable,
+for example lazily loaded relationships or `async def` methods.  These are
+awaited concurrently for each instance, and across the items of a list,
+optionally limited by a semaphore.
+
+When serializing a list, any `get_<field_name>_batch(instances)` methods
+are called once for the whole list, and may also be `async def` methods.
+
+Serializers that override `to_primative()` are serialized by calling it,
+once any awaitable value for the serializer itself has been awaited.
+"""
+from collections import OrderedDict
+from core_serializers.fields import get_batch_results
+from core_serializers.serializers import (
+    SerializerPlan, is_plain_list_serializer, is_plain_serializer,
+    rows_to_columns
+)
+import asyncio
+import inspect
+import operator
+
+
+async def limit_concurrency(func, serializer, data, concurrency):
+    """
+    Call `func(serializer, data, semaphore)` with a new semaphore limiting
+    the number of values that may be awaited at once.
+    """
+    semaphore = None if concurrency is None else asyncio.Semaphore(concurrency)
+    return await func(serializer, data, semaphore)
+
+
+async def limited(awaitable, semaphore):
+    """
+    Await a value, holding the semaphore if one is given.
+    """
+    if semaphore is None:
+        return await awaitable
+    async with semaphore:
+        return await awaitable
+
+
+def get_attribute(instance, attrs):
+    """
+    Look up a dotted source one attribute at a time, stopping at the first
+    awaitable value.  Returns the value and any attributes still to look up.
+    """
+    for index, attr in enumerate(attrs):
+        if inspect.isawaitable(instance):
+            return instance, attrs[index:]
+        instance = getattr(instance, attr)
+    return instance, ()
+
+
+async def resolve(field, value, convert, semaphore, attrs=()):
+    """
+    Await the attribute value for a field if required, along with each of
+    any remaining `attrs` of a dotted source, and then convert it to its
+    primative representation, awaiting the result if required.
+    """
+    if inspect.isawaitable(value):
+        value = await limited(value, semaphore)
+    for attr in attrs:
+        value = getattr(value, attr)
+        if inspect.isawaitable(value):
+            value = await limited(value, semaphore)
+    if is_plain_serializer(field):
+        return await serializer_to_primative(field, value, semaphore)
+    if is_plain_list_serializer(field):
+        return await list_to_primative(field, value, semaphore)
+    if convert is not None:
+        value = convert(value)
+        if inspect.isawaitable(value):
+            value = await limited(value, semaphore)
+    return value
+
+
+async def call_batch_method(method, instances, semaphore):
+    """
+    Call a batch method for a list of instances, awaiting the results if
+    required, and return a list of results in the same order.
+    """
+    results = method(instances)
+    if inspect.isawaitable(results):
+        results = await limited(results, semaphore)
+    return get_batch_results(method, instances, results)
+
+
+async def get_batch_values(serializer, instances, semaphore):
+    """
+    Call each of a serializer's batch methods once for a list of instances,
+    returning a dict of step index to value for each of the instances.
+    Method fields have a source of `'*'`, so are passed the instances.
+    """
+    plan = serializer.get_plan('plan', SerializerPlan)
+    batch_methods = plan.get_batch_methods(serializer)
+    rows = [{} for instance in instances]
+    if batch_methods:
+        columns = await asyncio.gather(*[
+            call_batch_method(method, instances, semaphore)
+            for method in batch_methods.values()
+        ])
+        for index, column in zip(batch_methods.keys(), columns):
+            for row, value in zip(rows, column):
+                row[index] = value
+    return rows
+
+
+async def serializer_to_primative(serializer, instance, semaphore=None, batch_values=None):
+    """
+    Object instance -> Dict of primitive datatypes.
+
+    `batch_values` is a dict of step index to value for any fields that
+    have already been resolved by a batch method.
+    """
+    if not is_plain_serializer(serializer):
+        return serializer.to_primative(instance)
+
+    plan = serializer.get_plan('plan', SerializerPlan)
+    steps = plan.get_steps(serializer)
+
+    ret = OrderedDict()
+    pending = OrderedDict()
+    for index, (field, (field_name, getter, convert)) in enumerate(zip(plan.fields, steps)):
+        attrs = ()
+        if batch_values and index in batch_values:
+            value = batch_values[index]
+            if inspect.isawaitable(value):
+                pending[field_name] = limited(value, semaphore)
+                value = None
+            ret[field_name] = value
+            continue
+        if getter is None:
+            value = instance
+        elif isinstance(getter, operator.attrgetter) and len(field.source_attrs) > 1:
+            # Any of the objects along a dotted source may be awaitable.
+            value, attrs = get_attribute(instance, field.source_attrs)
+        else:
+            value = getter(instance)
+        if inspect.isawaitable(value) or is_plain_serializer(field) or is_plain_list_serializer(field):
+            pending[field_name] = resolve(field, value, convert, semaphore, attrs)
+            value = None
+        elif convert is not None:
+            value = convert(value)
+            if inspect.isawaitable(value):
+                pending[field_name] = limited(value, semaphore)
+                value = None
+        ret[field_name] = value
+
+    if pending:
+        values = await asyncio.gather(*pending.values())
+        for field_name, value in zip(pending.keys(), values):
+            ret[field_name] = value
+    return ret
+
+
+async def list_to_primative(list_serializer, data, semaphore=None):
+    """
+    List of object instances -> List of dicts of primitive datatypes.
+
+    If `columnar` is set, then the rows are split into a dict of lists of
+    primitive datatypes, keyed by field name, as for `to_primative()`.  Any
+    `executor` is not used, as the items are awaited in the event loop.
+    """
+    if not is_plain_list_serializer(list_serializer):
+        return list_serializer.to_primative(data)
+
+    child = list_serializer.child
+    if is_plain_serializer(child):
+        data = list(data)
+        batch_values = await get_batch_values(child, data, semaphore)
+        items = [
+            serializer_to_primative(child, item, semaphore, values)
+            for item, values in zip(data, batch_values)
+        ]
+    else:
+        items = [resolve(child, item, child.to_primative, semaphore) for item in data]
+    rows = list(await asyncio.gather(*items))
+    if list_serializer.columnar:
+        return rows_to_columns(rows, child.get_plan('plan', SerializerPlan).field_names)
+    return rows
@@ -0,0 +1,394 @@
+"""
+Pure Python MessagePack and CBOR encoding, used by the binary renderers and
+parsers when the C accelerated `msgpack` and `cbor2` packages are not
+installed.
+
+Only the types that serializers produce are supported: `None`, booleans,
+integers, floats, text, bytes, lists and mappings.  Anything else is passed
+to `default(value)`, if given, which should return a supported value.
+
+Invalid input raises `ValueError` when decoding, including input that is
+nested more than `max_depth` arrays, maps or tags deep.
+"""
+from six import integer_types, string_types, text_type
+from six.moves.collections_abc import Mapping
+import binascii
+import math
+import struct
+
+
+def encode_failure(value, out, encode, default):
+    if default is None:
+        raise TypeError('%r cannot be encoded' % (value,))
+    encode(default(value), out, default)
+
+
+def decode_failure(msg):
+    raise ValueError(msg)
+
+
+# The default limit on nesting when decoding, which keeps well within
+# Python's recursion limit.
+max_depth = 256
+
+
+def encode_text(value):
+    if isinstance(value, text_type):
+        return value.encode('utf-8')
+    return value
+
+
+# MessagePack
+
+def msgpack_dumps(data, default=None):
+    """
+    Python data -> MessagePack bytes.
+    """
+    out = bytearray()
+    msgpack_encode(data, out, default)
+    return bytes(out)
+
+
+def msgpack_encode(value, out, default):
+    if value is None:
+        out.append(0xc0)
+    elif isinstance(value, bool):
+        out.append(0xc3 if value else 0xc2)
+    elif isinstance(value, integer_types):
+        if 0 <= value < 0x80:
+            out.append(value)
+        elif -0x20 <= value < 0:
+            out.append(value & 0xff)
+        elif value >= 0:
+            if value < 0x100:
+                out.extend(struct.pack('>BB', 0xcc, value))
+            elif value < 0x10000:
+                out.extend(struct.pack('>BH', 0xcd, value))
+            elif value < 0x100000000:
+                out.extend(struct.pack('>BI', 0xce, value))
+            elif value < 0x10000000000000000:
+                out.extend(struct.pack('>BQ', 0xcf, value))
+            else:
+                raise OverflowError('Integer too large for MessagePack.')
+        else:
+            if value >= -0x80:
+                out.extend(struct.pack('>Bb', 0xd0, value))
+            elif value >= -0x8000:
+                out.extend(struct.pack('>Bh', 0xd1, value))
+            elif value >= -0x80000000:
+                out.extend(struct.pack('>Bi', 0xd2, value))
+            elif value >= -0x8000000000000000:
+                out.extend(struct.pack('>Bq', 0xd3, value))
+            else:
+                raise OverflowError('Integer too large for MessagePack.')
+    elif isinstance(value, float):
+        out.extend(struct.pack('>Bd', 0xcb, value))
+    elif isinstance(value, string_types):
+        encoded = encode_text(value)
+        msgpack_header(len(encoded), out, 0xa0, 0x20, (0xd9, 0xda, 0xdb))
+        out.extend(encoded)
+    elif isinstance(value, (bytes, bytearray)):
+        msgpack_header(len(value), out, None, 0, (0xc4, 0xc5, 0xc6))
+        out.extend(value)
+    elif isinstance(value, (list, tuple)):
+        msgpack_header(len(value), out, 0x90, 0x10, (None, 0xdc, 0xdd))
+        for item in value:
+            msgpack_encode(item, out, default)
+    elif isinstance(value, Mapping):
+        msgpack_header(len(value), out, 0x80, 0x10, (None, 0xde, 0xdf))
+        for key, item in value.items():
+            msgpack_encode(key, out, default)
+            msgpack_encode(item, out, default)
+    else:
+        encode_failure(value, out, msgpack_encode, default)
+
+
+def msgpack_header(length, out, fix_type, fix_limit, types):
+    """
+    Write the header for a string, binary, array or map of `length` items,
+    using the fixed size type if possible, otherwise the smallest of the
+    8, 16 and 32 bit length types.
+    """
+    type8, type16, type32 = types
+    if length < fix_limit:
+        out.append(fix_type | length)
+    elif length < 0x100 and type8 is not None:
+        out.extend(struct.pack('>BB', type8, length))
+    elif length < 0x10000:
+        out.extend(struct.pack('>BH', type16, length))
+    elif length < 0x100000000:
+        out.extend(struct.pack('>BI', type32, length))
+    else:
+        raise OverflowError('Too many items for MessagePack.')
+
+
+# Maps each MessagePack type byte to a `(struct format, kind)` pair, where
+# kind is one of `int`, `float`, `str`, `bin`, `array` or `map`, and the
+# struct format reads either the value or the length.
+msgpack_types = {
+    0xc4: ('>B', 'bin'), 0xc5: ('>H', 'bin'), 0xc6: ('>I', 'bin'),
+    0xca: ('>f', 'float'), 0xcb: ('>d', 'float'),
+    0xcc: ('>B', 'int'), 0xcd: ('>H', 'int'), 0xce: ('>I', 'int'), 0xcf: ('>Q', 'int'),
+    0xd0: ('>b', 'int'), 0xd1: ('>h', 'int'), 0xd2: ('>i', 'int'), 0xd3: ('>q', 'int'),
+    0xd9: ('>B', 'str'), 0xda: ('>H', 'str'), 0xdb: ('>I', 'str'),
+    0xdc: ('>H', 'array'), 0xdd: ('>I', 'array'),
+    0xde: ('>H', 'map'), 0xdf: ('>I', 'map'),
+}
+
+
+def msgpack_loads(data, max_depth=max_depth):
+    """
+    MessagePack bytes -> Python data.
+    """
+    data = bytearray(data)
+    try:
+        value, offset = msgpack_decode(data, 0, max_depth)
+    except (IndexError, struct.error):
+        decode_failure('Truncated MessagePack data.')
+    if offset != len(data):
+        decode_failure('Extra data after MessagePack value.')
+    return value
+
+
+def msgpack_decode(data, offset, depth):
+    first = data[offset]
+    offset += 1
+    if first < 0x80:
+        return first, offset
+    if first >= 0xe0:
+        return first - 0x100, offset
+    if first < 0x90:
+        kind, length = 'map', first & 0x0f
+    elif first < 0xa0:
+        kind, length = 'array', first & 0x0f
+    elif first < 0xc0:
+        kind, length = 'str', first & 0x1f
+    elif first == 0xc0:
+        return None, offset
+    elif first == 0xc2:
+        return False, offset
+    elif first == 0xc3:
+        return True, offset
+    elif first in msgpack_types:
+        fmt, kind = msgpack_types[first]
+        length = struct.unpack_from(fmt, data, offset)[0]
+        offset += struct.calcsize(fmt)
+        if kind in ('int', 'float'):
+            return length, offset
+    else:
+        decode_failure('Unsupported MessagePack type 0x%02x.' % first)
+    return decode_container(msgpack_decode, data, offset, kind, length, depth)
+
+
+def check_depth(depth):
+    if depth <= 0:
+        decode_failure('Data is nested too deeply.')
+    return depth - 1
+
+
+def set_item(ret, key, value):
+    try:
+        ret[key] = value
+    except TypeError:
+        decode_failure('Invalid map key %r.' % (key,))
+
+
+def decode_container(decode, data, offset, kind, length, depth):
+    """
+    Decode a string, binary, array or map of `length` items.
+    """
+    if kind in ('str', 'bin'):
+        end = offset + length
+        if end > len(data):
+            decode_failure('Truncated data.')
+        value = bytes(data[offset:end])
+        return (value.decode('utf-8') if kind == 'str' else value), end
+    depth = check_depth(depth)
+    if kind == 'array':
+        ret = []
+        for idx in range(length):
+            item, offset = decode(data, offset, depth)
+            ret.append(item)
+        return ret, offset
+    ret = {}
+    for idx in range(length):
+        key, offset = decode(data, offset, depth)
+        value, offset = decode(data, offset, depth)
+        set_item(ret, key, value)
+    return ret, offset
+
+
+# CBOR
+
+def cbor_dumps(data, default=None):
+    """
+    Python data -> CBOR bytes.
+    """
+    out = bytearray()
+    cbor_encode(data, out, default)
+    return bytes(out)
+
+
+def cbor_header(major, argument, out):
+    major <<= 5
+    if argument < 24:
+        out.append(major | argument)
+    elif argument < 0x100:
+        out.extend(struct.pack('>BB', major | 24, argument))
+    elif argument < 0x10000:
+        out.extend(struct.pack('>BH', major | 25, argument))
+    elif argument < 0x100000000:
+        out.extend(struct.pack('>BI', major | 26, argument))
+    else:
+        out.extend(struct.pack('>BQ', major | 27, argument))
+
+
+def cbor_encode(value, out, default):
+    if value is None:
+        out.append(0xf6)
+    elif isinstance(value, bool):
+        out.append(0xf5 if value else 0xf4)
+    elif isinstance(value, integer_types):
+        major, argument = (0, value) if value >= 0 else (1, -1 - value)
+        if argument < 0x10000000000000000:
+            cbor_header(major, argument, out)
+        else:
+            # Bignums are tagged big-endian byte strings.
+            digits = '%x' % argument
+            payload = binascii.unhexlify(digits.zfill(len(digits) + len(digits) % 2))
+            cbor_header(6, 2 + major, out)
+            cbor_header(2, len(payload), out)
+            out.extend(payload)
+    elif isinstance(value, float):
+        out.extend(struct.pack('>Bd', 0xfb, value))
+    elif isinstance(value, string_types):
+        encoded = encode_text(value)
+        cbor_header(3, len(encoded), out)
+        out.extend(encoded)
+    elif isinstance(value, (bytes, bytearray)):
+        cbor_header(2, len(value), out)
+        out.extend(value)
+    elif isinstance(value, (list, tuple)):
+        cbor_header(4, len(value), out)
+        for item in value:
+            cbor_encode(item, out, default)
+    elif isinstance(value, Mapping):
+        cbor_header(5, len(value), out)
+        for key, item in value.items():
+            cbor_encode(key, out, default)
+            cbor_encode(item, out, default)
+    else:
+        encode_failure(value, out, cbor_encode, default)
+
+
+def cbor_loads(data, max_depth=max_depth):
+    """
+    CBOR bytes -> Python data.
+    """
+    data = bytearray(data)
+    try:
+        value, offset = cbor_decode(data, 0, max_depth)
+    except (IndexError, struct.error):
+        decode_failure('Truncated CBOR data.')
+    if offset != len(data):
+        decode_failure('Extra data after CBOR value.')
+    return value
+
+
+cbor_argument_formats = {24: '>B', 25: '>H', 26: '>I', 27: '>Q'}
+cbor_kinds = {2: 'bin', 3: 'str', 4: 'array', 5: 'map'}
+cbor_simple_values = {20: False, 21: True, 22: None, 23: None}
+cbor_string_majors = {'bin': 2, 'str': 3}
+
+
+def cbor_decode(data, offset, depth):
+    first = data[offset]
+    offset += 1
+    major, info = first >> 5, first & 0x1f
+
+    if major == 7:
+        if info in cbor_simple_values:
+            return cbor_simple_values[info], offset
+        if info == 25:
+            return decode_half_float(struct.unpack_from('>H', data, offset)[0]), offset + 2
+        if info == 26:
+            return struct.unpack_from('>f', data, offset)[0], offset + 4
+        if info == 27:
+            return struct.unpack_from('>d', data, offset)[0], offset + 8
+        if info == 31:
+            decode_failure('Unexpected CBOR break outside an indefinite length item.')
+        decode_failure('Unsupported CBOR simple value %d.' % info)
+
+    if info < 24:
+        argument = info
+    elif info in cbor_argument_formats:
+        fmt = cbor_argument_formats[info]
+        argument = struct.unpack_from(fmt, data, offset)[0]
+        offset += struct.calcsize(fmt)
+    elif info == 31 and major in cbor_kinds:
+        return cbor_decode_indefinite(data, offset, cbor_kinds[major], depth)
+    else:
+        decode_failure('Invalid CBOR header 0x%02x.' % first)
+
+    if major == 0:
+        return argument, offset
+    if major == 1:
+        return -1 - argument, offset
+    if major == 6:
+        value, offset = cbor_decode(data, offset, check_depth(depth))
+        return cbor_untag(argument, value), offset
+    return decode_container(cbor_decode, data, offset, cbor_kinds[major], argument, depth)
+
+
+def cbor_untag(tag, value):
+    """
+    Return the value of a CBOR tag.  Bignums are decoded into integers,
+    and other tags, such as dates, are returned as their untagged value.
+    """
+    if tag in (2, 3) and isinstance(value, bytes):
+        number = int(binascii.hexlify(value) or b'0', 16)
+        return number if tag == 2 else -1 - number
+    return value
+
+
+def cbor_decode_indefinite(data, offset, kind, depth):
+    """
+    Decode an indefinite length string, binary, array or map, which ends
+    with a "break" byte.  Strings and binaries are made up of chunks that
+    are definite length strings or binaries.
+    """
+    depth = check_depth(depth)
+    chunk_major = cbor_string_majors.get(kind)
+    items = []
+    while data[offset] != 0xff:
+        if chunk_major is not None and (
+            data[offset] >> 5 != chunk_major or data[offset] & 0x1f == 31
+        ):
+            decode_failure('Invalid chunk in indefinite length CBOR %s.' % kind)
+        item, offset = cbor_decode(data, offset, depth)
+        items.append(item)
+    offset += 1
+    if kind == 'str':
+        return u''.join(items), offset
+    if kind == 'bin':
+        return b''.join(items), offset
+    if kind == 'array':
+        return items, offset
+    if len(items) % 2:
+        decode_failure('Odd number of items in CBOR map.')
+    ret = {}
+    for key, value in zip(items[::2], items[1::2]):
+        set_item(ret, key, value)
+    return ret, offset
+
+
+def decode_half_float(bits):
+    exponent = (bits >> 10) & 0x1f
+    mantissa = bits & 0x3ff
+    if exponent == 0:
+        value = math.ldexp(mantissa, -24)
+    elif exponent == 0x1f:
+        value = float('inf') if mantissa == 0 else float('nan')
+    else:
+        value = math.ldexp(mantissa + 0x400, exponent - 25)
+    return -value if bits & 0x8000 else value
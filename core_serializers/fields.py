@@ -1,4 +1,7 @@
+from six import integer_types, string_types, text_type
+from six.moves.collections_abc import Mapping
 from core_serializers.utils import empty, get_attribute, is_html_input
+from functools import partial
 
 
 class ValidationError(Exception):
@@ -128,6 +131,16 @@ class Field(object):
         """
         return data
 
+    def to_native_many(self, data):
+        """
+        Transform a list of *incoming* primative data into native values.
+
+        Used by `ListSerializer` to convert lists of scalar values at once.
+        Raises `ValidationError` if any of the items are invalid, in which
+        case the items are validated one at a time to find which.
+        """
+        return [self.to_native(item) for item in data]
+
     def to_primative(self, value):
         """
         Transform the *outgoing* native value into primative data.
@@ -184,6 +197,11 @@ class CharField(Field):
             self.fail('blank')
         return str(data)
 
+    def to_native_many(self, data):
+        if not self.allow_blank and '' in data:
+            self.fail('blank')
+        return list(map(str, data))
+
 
 class ChoiceField(Field):
     MESSAGES = {
@@ -216,9 +234,20 @@ class ChoiceField(Field):
             str(key): key for key in self.choices.keys()
         }
 
+        # Inputs that are already one of the choices, of the same type, are
+        # looked up directly without converting them to strings.
+        self.choice_keys = frozenset(self.choices.keys())
+        self.choice_types = frozenset([type(key) for key in self.choices.keys()])
+
         super(ChoiceField, self).__init__(*args, **kwargs)
 
     def to_native(self, data):
+        if type(data) in self.choice_types:
+            try:
+                if data in self.choice_keys:
+                    return data
+            except TypeError:
+                pass
         try:
             return self.choice_strings_to_values[str(data)]
         except KeyError:
@@ -232,9 +261,29 @@ class MultipleChoiceField(ChoiceField):
         'not_a_list': 'Expected a list of items but got type `{input_type}`'
     }
 
+    def get_value(self, dictionary):
+        if is_html_input(dictionary):
+            # HTML forms send every selected option under the same name.
+            if self.field_name not in dictionary:
+                return empty
+            return dictionary.getlist(self.field_name)
+        return dictionary.get(self.field_name, empty)
+
     def to_native(self, data):
-        if not hasattr(data, '__iter__'):
+        if isinstance(data, string_types) or not hasattr(data, '__iter__'):
             self.fail('not_a_list', input_type=type(data).__name__)
+        if not isinstance(data, (list, tuple, set, frozenset)):
+            data = list(data)
+        # Validate every item at once if they are all choices, of the same
+        # types, otherwise look up each item to find the invalid one.  The
+        # types are checked before building the set, as `True == 1`.
+        if set(map(type, data)) <= self.choice_types:
+            try:
+                values = set(data)
+            except TypeError:
+                values = None
+            if values is not None and values <= self.choice_keys:
+                return values
         return set([
             super(MultipleChoiceField, self).to_native(item)
             for item in data
@@ -244,16 +293,82 @@ class MultipleChoiceField(ChoiceField):
 class IntegerField(Field):
     MESSAGES = {
         'required': 'This field is required.',
-        'invalid_integer': 'A valid integer is required.'
+        'invalid_integer': 'A valid integer is required.',
+        'max_value': 'Ensure this value is less than or equal to {max_value}.',
+        'min_value': 'Ensure this value is greater than or equal to {min_value}.'
     }
+    # Integers are returned as they are, and strings are parsed directly.
+    # Anything else, such as `True` or `1.5`, must have a string
+    # representation that is an integer.
+    INTEGER_TYPES = frozenset(integer_types)
+    STRING_TYPES = frozenset([str, text_type])
+
+    def __init__(self, *args, **kwargs):
+        self.max_value = kwargs.pop('max_value', None)
+        self.min_value = kwargs.pop('min_value', None)
+        super(IntegerField, self).__init__(*args, **kwargs)
 
     def to_native(self, data):
-        try:
-            data = int(str(data))
-        except (ValueError, TypeError):
-            self.fail('invalid_integer')
+        data_type = type(data)
+        if data_type not in self.INTEGER_TYPES:
+            try:
+                data = int(data if data_type in self.STRING_TYPES else str(data))
+            except (ValueError, TypeError):
+                self.fail('invalid_integer')
+        if self.max_value is not None and data > self.max_value:
+            self.fail('max_value', max_value=self.max_value)
+        if self.min_value is not None and data < self.min_value:
+            self.fail('min_value', min_value=self.min_value)
         return data
 
+    def to_native_many(self, data):
+        data_types = set(map(type, data))
+        if data_types <= self.INTEGER_TYPES:
+            values = list(data)
+        elif data_types <= self.STRING_TYPES:
+            try:
+                values = list(map(int, data))
+            except ValueError:
+                self.fail('invalid_integer')
+        else:
+            return [self.to_native(item) for item in data]
+        if values and self.max_value is not None and max(values) > self.max_value:
+            self.fail('max_value', max_value=self.max_value)
+        if values and self.min_value is not None and min(values) < self.min_value:
+            self.fail('min_value', min_value=self.min_value)
+        return values
+
+
+def call_batch_method(method, instances):
+    """
+    Call a `get_<field_name>_batch(instances)` method, which may return
+    either a list of results in the same order as the instances, or a
+    mapping of instances to results.  Instances missing from a mapping
+    get a result of `None`, but a list must have a result for every instance.
+    """
+    return get_batch_results(method, instances, method(instances))
+
+
+def get_batch_results(method, instances, results):
+    """
+    Return the results of calling a batch method as a list, in the same
+    order as the instances.
+    """
+    if isinstance(results, Mapping):
+        return [results.get(instance) for instance in instances]
+    results = list(results)
+    if len(results) != len(instances):
+        msg = '`%s()` returned %d results for %d instances.'
+        raise AssertionError(msg % (method.__name__, len(results), len(instances)))
+    return results
+
+
+def call_batch_method_once(method, instance):
+    """
+    Call a batch method for a single instance.
+    """
+    return call_batch_method(method, [instance])[0]
+
 
 class MethodField(Field):
     def __init__(self, **kwargs):
@@ -261,7 +376,26 @@ class MethodField(Field):
         kwargs['read_only'] = True
         super(MethodField, self).__init__(**kwargs)
 
+    def bind(self, field_name, parent, root):
+        # Look up the method once, rather than every time it is called.
+        super(MethodField, self).bind(field_name, parent, root)
+        self.method_name = 'get_' + field_name
+        self.method = self.resolve_method(parent)
+
+    def resolve_method(self, serializer):
+        """
+        Return the method on `serializer` that provides this field's value,
+        falling back to its batch method, or `None` if neither exists.
+        """
+        method = getattr(serializer, self.method_name, None)
+        if method is None:
+            batch_method = getattr(serializer, self.method_name + '_batch', None)
+            if batch_method is not None:
+                method = partial(call_batch_method_once, batch_method)
+        return method
+
     def to_primative(self, value):
-        attr = 'get_{field_name}'.format(field_name=self.field_name)
-        method = getattr(self.parent, attr)
-        return method(value)
+        if self.method is None:
+            # Fail with the usual error for a missing method.
+            getattr(self.parent, self.method_name)
+        return self.method(value)
@@ -1,12 +1,12 @@
 from jinja2 import Markup
 from core_serializers.renderers import FormRenderer
 
+renderer = FormRenderer()
+
 
 def render_form(data, **options):
-    renderer = FormRenderer()
     return Markup(renderer.render(data, **options))
 
 
 def render_field(field_item, **options):
-    renderer = FormRenderer()
     return Markup(renderer.render_field(field_item, **options))
@@ -0,0 +1,107 @@
+"""
+Parsers turn request bodies into primative data, for use as
+`Serializer(data=...)`.  Invalid input raises `ValueError`.
+"""
+from core_serializers import binary
+from six.moves.collections_abc import Mapping
+import io
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+
+def read(stream):
+    """
+    Return the contents of either a file-like object, or bytes or text.
+    """
+    if hasattr(stream, 'read'):
+        return stream.read()
+    return stream
+
+
+def reject_msgpack_ext(code, data):
+    raise ValueError('Unsupported MessagePack extension type %d.' % code)
+
+
+# The accelerated CBOR decoder is set up to return the same data as
+# `binary.cbor_loads`, so that tags are returned as their untagged value
+# and maps may only have the keys that a `dict` accepts.
+
+def untag_cbor(tag, immutable):
+    return binary.cbor_untag(tag.tag, tag.value)
+
+
+def cbor_semantic_decoder(tag):
+    return lambda value, immutable: binary.cbor_untag(tag, value)
+
+
+# The tags that `cbor2` decodes itself, rather than passing to `tag_hook`.
+cbor_semantic_decoders = dict(
+    (tag, cbor_semantic_decoder(tag)) for tag in (
+        0, 1, 2, 3, 4, 5, 25, 28, 29, 30, 35, 36, 37, 52, 54, 100,
+        256, 258, 260, 261, 1004, 43000, 55799
+    )
+)
+
+
+def check_cbor_map_keys(value, immutable):
+    for key in value:
+        # `cbor2` decodes arrays and maps used as keys into tuples and
+        # frozen dicts.
+        if isinstance(key, (tuple, Mapping)):
+            raise ValueError('Invalid map key %r.' % (key,))
+    return value
+
+
+class JSONParser:
+    def parse(self, stream):
+        data = read(stream)
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class MsgPackParser:
+    # Use the C accelerated `msgpack` package, if it is installed.
+    accelerated = msgpack is not None
+
+    def parse(self, stream):
+        data = read(stream)
+        if self.accelerated:
+            try:
+                return msgpack.unpackb(
+                    data, raw=False, strict_map_key=False, ext_hook=reject_msgpack_ext
+                )
+            except (msgpack.UnpackException, TypeError) as exc:
+                raise ValueError(str(exc))
+        return binary.msgpack_loads(data)
+
+
+class CBORParser:
+    # Use the C accelerated `cbor2` package, if it is installed.
+    accelerated = cbor2 is not None
+
+    def parse(self, stream):
+        data = read(stream)
+        if self.accelerated:
+            stream = io.BytesIO(data)
+            decoder = cbor2.CBORDecoder(
+                stream, tag_hook=untag_cbor, object_hook=check_cbor_map_keys,
+                semantic_decoders=cbor_semantic_decoders, max_depth=binary.max_depth
+            )
+            try:
+                value = decoder.decode()
+            except (cbor2.CBORDecodeError, TypeError) as exc:
+                raise ValueError(str(exc))
+            if stream.tell() != len(data):
+                raise ValueError('Extra data after CBOR value.')
+            return value
+        return binary.cbor_loads(data)
@@ -1,16 +1,114 @@
-from jinja2 import Environment, PackageLoader
+from six import get_unbound_function, integer_types, string_types, text_type
+from six.moves.collections_abc import Mapping
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
+from array import array
+from collections import OrderedDict, namedtuple
+from core_serializers import binary
+from core_serializers.fields import (
+    BooleanField, CharField, ChoiceField, IntegerField, MultipleChoiceField,
+    call_batch_method
+)
+from core_serializers.serializers import (
+    SerializerPlan, is_plain_list_serializer, is_plain_serializer
+)
+from core_serializers.utils import iter_chunks
+from json.encoder import encode_basestring_ascii
+import csv
+import io
 import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import rapidjson
+except ImportError:
+    rapidjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 env = Environment(loader=PackageLoader('core_serializers', 'templates'))
 
+# Compiled templates, so that rendering does not need to check the template
+# loader for changes every time that a template is used.
+templates = {}
+
+
+def get_template(template_name):
+    try:
+        return templates[template_name]
+    except KeyError:
+        template = templates[template_name] = env.get_template(template_name)
+        return template
+
+
+def precompile_templates(bytecode_cache_dir=None):
+    """
+    Compile all of the packaged templates up front, rather than on first use.
+
+    If `bytecode_cache_dir` is given then the compiled templates are also
+    cached on disk, so that later processes can load them without parsing.
+    """
+    if bytecode_cache_dir is not None:
+        env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+        # Recompile anything already loaded, so the cache gets populated.
+        env.cache.clear()
+        templates.clear()
+    for template_name in env.list_templates(extensions=['html']):
+        get_template(template_name)
+
+
+def get_inlined_source(template_name):
+    """
+    Return the source for a template, with any included templates inlined.
+    """
+    source = env.loader.get_source(env, template_name)[0]
+    if source.endswith('\n') and not env.keep_trailing_newline:
+        source = source[:-1]
+    return include_re.sub(lambda match: get_inlined_source(match.group(1)), source)
+
+
+include_re = re.compile(r'{%\s*include\s+["\']([^"\']+)["\']\s*%}')
+form_loop_re = re.compile(r'{%\s*for field_result in form\s*%}.*?{%\s*endfor\s*%}', re.DOTALL)
+
 
 class FormRenderer:
     template_name = 'form.html'
 
-    def render_field(self, field_result, **options):
-        field, value, error = field_result
+    # Maps `(renderer class, field class, style type, layout)` to the
+    # template and extra context used to render a field.
+    field_templates = {}
+
+    # Maps `(renderer class, layout, field templates)` to the compiled
+    # template used to render a whole form.
+    form_templates = {}
+
+    def get_field_template(self, field, layout):
+        """
+        Return the template and any extra context for rendering a field.
+        """
         class_name = field.__class__.__name__
-        layout = options.get('layout', 'vertical')
 
         context = {}
         if class_name == 'BooleanField':
@@ -37,22 +135,777 @@ class FormRenderer:
                 context = {'input_type': 'text'}
 
         template_name = 'fields/' + layout + '/' + base
-        template = env.get_template(template_name)
+        return get_template(template_name), context
+
+    def lookup_field_template(self, field, layout):
+        key = (self.__class__, field.__class__, field.style.get('type'), layout)
+        try:
+            return self.field_templates[key]
+        except KeyError:
+            template, context = self.get_field_template(field, layout)
+            self.field_templates[key] = (template, context)
+            return template, context
+
+    def render_field(self, field_result, **options):
+        field, value, error = field_result
+        layout = options.get('layout', 'vertical')
+        template, context = self.lookup_field_template(field, layout)
         return template.render(field=field, value=value, **context)
 
+    def get_form_template(self, form, layout):
+        """
+        Return a single template that renders the whole form.
+
+        The template is compiled once per set of field templates and layout,
+        and is looked up again if the fields are modified on the serializer
+        instance.  Renderers that override `render_field()` use the form
+        template as it is, which calls `render_field()` for each field.
+        """
+        if self.overrides_render_field():
+            return get_template(self.template_name)
+        key = ('form_template', self.__class__, layout)
+        return form.fields.cached(key, lambda fields: self.lookup_form_template(fields, layout))
+
+    def overrides_render_field(self):
+        render_field = get_unbound_function(self.__class__.render_field)
+        return render_field is not get_unbound_function(FormRenderer.render_field)
+
+    def lookup_form_template(self, fields, layout):
+        field_templates = tuple(
+            self.lookup_field_template(field, layout)
+            for field in fields.get_fields().values()
+        )
+        key = (self.__class__, layout, tuple(
+            (template.name, tuple(sorted(context.items())))
+            for template, context in field_templates
+        ))
+        try:
+            return self.form_templates[key]
+        except KeyError:
+            template = self.compile_form_template(field_templates)
+            self.form_templates[key] = template
+            return template
+
+    def compile_form_template(self, field_templates):
+        """
+        Build the form template with each field's template inlined in place
+        of the loop over the form's fields.
+        """
+        source = get_inlined_source(self.template_name)
+        if form_loop_re.search(source) is None:
+            return get_template(self.template_name)
+
+        body = []
+        for index, (template, context) in enumerate(field_templates):
+            names = ['field=items[%d].field' % index, 'value=items[%d].value' % index]
+            names.extend([
+                '%s=%s' % (name, json.dumps(value))
+                for name, value in sorted(context.items())
+            ])
+            body.append('{%% with %s %%}%s{%% endwith %%}' % (
+                ', '.join(names), get_inlined_source(template.name)
+            ))
+        source = form_loop_re.sub(lambda match: '\n'.join(body), source)
+        return env.from_string(source)
+
     def render(self, form, **options):
         style = getattr(getattr(form, 'Meta', None), 'style', {})
         layout = style.get('layout', 'vertical')
-        template = env.get_template(self.template_name)
-        return template.render(form=form, renderer=self, layout=layout)
+        template = self.get_form_template(form, layout)
+        return template.render(form=form, items=list(form), renderer=self, layout=layout)
+
+
+def encode_default(value):
+    """
+    Return a JSON compatible version of a primative value that JSON has no
+    type for, such as the sets returned by `MultipleChoiceField`.
+    """
+    if isinstance(value, (set, frozenset)):
+        try:
+            return sorted(value)
+        except TypeError:
+            return list(value)
+    if isinstance(value, Mapping):
+        # Key the dict the way `json.dumps` would, so that backends which only
+        # accept string keys do not hand the same mapping straight back to us.
+        return dict((encode_key(key), item) for key, item in value.items())
+    raise TypeError('%r is not JSON serializable' % (value,))
+
+
+def encode_key(key):
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    raise TypeError('keys must be str, int, float, bool or None, not %s' % type(key).__name__)
+
+
+def stdlib_dumps(data, indent=None):
+    return json.dumps(data, indent=indent, default=encode_default)
+
+
+def orjson_dumps(data, indent=None):
+    # orjson only supports an indent of two spaces.
+    if indent not in (None, 2):
+        return stdlib_dumps(data, indent=indent).encode('utf-8')
+    option = orjson.OPT_NON_STR_KEYS
+    if indent is not None:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, default=encode_default, option=option)
+    except orjson.JSONEncodeError:
+        # Integers wider than 64 bits, for example.
+        return stdlib_dumps(data, indent=indent).encode('utf-8')
+
+
+def rapidjson_dumps(data, indent=None):
+    return rapidjson.dumps(data, indent=indent, default=encode_default)
+
+
+def ujson_dumps(data, indent=None):
+    return ujson.dumps(
+        data, indent=indent or 0, default=encode_default,
+        escape_forward_slashes=False
+    )
+
+
+# Maps each installed JSON backend's name to a `dumps(data, indent)`
+# function, which returns either text or UTF-8 encoded bytes.
+json_backends = OrderedDict([('stdlib', stdlib_dumps)])
+if orjson is not None:
+    json_backends['orjson'] = orjson_dumps
+if rapidjson is not None:
+    json_backends['rapidjson'] = rapidjson_dumps
+if ujson is not None:
+    json_backends['ujson'] = ujson_dumps
+
+# The backends used by `backend='auto'`, fastest first.
+auto_json_backends = ['orjson', 'rapidjson', 'ujson', 'stdlib']
+
+
+def get_json_backend(name):
+    """
+    Return the `dumps` function for a JSON backend, or for `'auto'` the
+    fastest installed backend.
+    """
+    if name == 'auto':
+        name = next(name for name in auto_json_backends if name in json_backends)
+    try:
+        return json_backends[name]
+    except KeyError:
+        msg = 'JSON backend `{name}` is not installed. Installed backends are: {names}.'
+        raise ValueError(msg.format(name=name, names=', '.join(json_backends.keys())))
+
+
+# Encoders for the values that `json.dumps` writes without any nesting.
+value_encoders = {
+    text_type: encode_basestring_ascii,
+    str: encode_basestring_ascii,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+for integer_type in integer_types:
+    value_encoders[integer_type] = integer_type.__repr__
+
+
+def encode_value(value):
+    encode = value_encoders.get(type(value))
+    if encode is None:
+        return stdlib_dumps(value)
+    return encode(value)
+
+
+def is_inline_list_serializer(field):
+    """
+    Return `True` for lists of nested serializers that may be written in place.
+    """
+    if not is_plain_list_serializer(field) or field.executor is not None or field.columnar:
+        return False
+    return is_plain_serializer(field.child)
+
+
+def get_batch_writer(values):
+    """
+    Return a writer that ignores its value, and instead writes the next of
+    the values returned by a batch method.
+    """
+    values = iter(values)
+    return lambda value, parts: parts.append(encode_value(next(values)))
+
+
+class JSONPlan(object):
+    """
+    Encodes object instances straight to JSON text using a serializer's plan,
+    without first building dictionaries of primative values.
+
+    Each field is written as a pre-encoded `"field_name": ` key, followed by
+    its value.  Nested serializers are written in place, and other values are
+    encoded according to their type.  The output is the same as that of
+    `json.dumps()` for the serializer's data.
+    """
+
+    def __init__(self, fields):
+        self.plan = fields.cached('plan', SerializerPlan)
+        self.keys = [
+            ('' if index == 0 else ', ') + encode_basestring_ascii(field_name) + ': '
+            for index, field_name in enumerate(self.plan.field_names)
+        ]
+        self.writers = None
+
+    def get_writers(self, serializer):
+        """
+        Return a `(key, getter, write)` tuple for each field, where
+        `write(value, parts)` appends the encoded value to a list of parts.
+
+        The writers are kept on the plan, unless there are method fields
+        bound to `serializer`, in which case they are kept on the serializer.
+        """
+        steps = self.plan.get_steps(serializer)
+        if steps is self.plan.steps:
+            if self.writers is None:
+                self.writers = self.build_writers(steps)
+            return self.writers
+        cached = serializer.__dict__.get('_json_writers')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        writers = self.build_writers(steps)
+        serializer._json_writers = (self, writers)
+        return writers
+
+    def build_writers(self, steps):
+        return [
+            (key, getter, self.get_writer(field, convert))
+            for key, field, (field_name, getter, convert)
+            in zip(self.keys, self.plan.fields, steps)
+        ]
+
+    def get_writer(self, field, convert):
+        if is_plain_serializer(field):
+            plan = field.get_plan('json_plan', JSONPlan)
+            return lambda value, parts: plan.write(value, field, parts)
+        if is_inline_list_serializer(field):
+            child = field.child
+            plan = child.get_plan('json_plan', JSONPlan)
+            return lambda value, parts: plan.write_many(value, child, parts)
+        if convert is None:
+            return lambda value, parts: parts.append(encode_value(value))
+        return lambda value, parts: parts.append(encode_value(convert(value)))
+
+    def write(self, instance, serializer, parts, writers=None):
+        """
+        Append the JSON for an object instance to a list of parts.
+        """
+        if writers is None:
+            writers = self.get_writers(serializer)
+        parts.append('{')
+        for key, getter, write in writers:
+            parts.append(key)
+            write(instance if getter is None else getter(instance), parts)
+        parts.append('}')
+
+    def write_many(self, instances, serializer, parts):
+        """
+        Append the JSON for a list of object instances to a list of parts.
+
+        Any `get_<field_name>_batch(instances)` methods are called once for
+        the whole list, as for `Serializer.to_primative_many()`.
+        """
+        writers = self.get_writers(serializer)
+        batch_methods = self.plan.get_batch_methods(serializer)
+        if batch_methods:
+            instances = list(instances)
+            writers = list(writers)
+            for index, batch_method in batch_methods.items():
+                key, getter, write = writers[index]
+                column = instances if getter is None else list(map(getter, instances))
+                values = call_batch_method(batch_method, column)
+                writers[index] = (key, None, get_batch_writer(values))
+
+        parts.append('[')
+        separator = ''
+        for instance in instances:
+            parts.append(separator)
+            self.write(instance, serializer, parts, writers)
+            separator = ', '
+        parts.append(']')
 
 
 class JSONRenderer:
     indent = None
+    backend = 'stdlib'
 
-    def __init__(self, indent=None):
+    def __init__(self, indent=None, backend=None):
         self.indent = self.indent if (indent is None) else indent
+        self.backend = self.backend if (backend is None) else backend
+        self.dumps = get_json_backend(self.backend)
 
     def render(self, data, **options):
+        """
+        Render data as JSON, which is bytes rather than text for backends
+        that encode directly to UTF-8, such as orjson.
+        """
+        indent = options.get('indent', self.indent)
+        return self.dumps(data, indent=indent)
+
+    def render_serializer(self, serializer, **options):
+        """
+        Render a serializer's data as JSON.
+
+        For a serializer with an instance, or a list serializer of
+        serializers, using the standard library backend without indenting,
+        the JSON is encoded directly from the instances.
+        """
         indent = options.get('indent', self.indent)
-        return json.dumps(data, indent=indent)
+        if indent is None and self.dumps is stdlib_dumps and serializer.instance is not None:
+            if is_plain_serializer(serializer):
+                return self.render_instance(serializer, serializer.instance)
+            if is_inline_list_serializer(serializer):
+                return self.render_instances(serializer.child, serializer.instance)
+        return self.render(serializer.data, **options)
+
+    def render_instance(self, serializer, instance):
+        """
+        Encode an object instance straight to JSON, giving the same output
+        as `json.dumps(serializer.to_primative(instance))`.
+        """
+        parts = []
+        plan = serializer.get_plan('json_plan', JSONPlan)
+        plan.write(instance, serializer, parts)
+        return ''.join(parts)
+
+    def render_instances(self, serializer, instances):
+        """
+        Encode a list of object instances straight to JSON, giving the same
+        output as `json.dumps(serializer.to_primative_many(instances))`.
+        """
+        parts = []
+        plan = serializer.get_plan('json_plan', JSONPlan)
+        plan.write_many(instances, serializer, parts)
+        return ''.join(parts)
+
+    def render_iter(self, data, **options):
+        """
+        Render an iterable of items as a JSON array, yielding the output a
+        chunk at a time, so that only one item needs to be held in memory.
+
+        As for `render()`, the chunks are bytes for backends that encode
+        directly to UTF-8.
+        """
+        indent = options.get('indent', self.indent)
+        if indent is None:
+            newline = ''
+            start, separator, end = '[', ', ', ']'
+        else:
+            newline = '\n' + ' ' * indent
+            start, separator, end = '[' + newline, ',' + newline, '\n]'
+
+        chunk_prefix = None
+        for item in data:
+            chunk = self.dumps(item, indent=indent)
+            if chunk_prefix is None:
+                if isinstance(chunk, bytes):
+                    start, separator, end, newline = [
+                        text.encode('utf-8') for text in (start, separator, end, newline)
+                    ]
+                chunk_prefix = start
+            if newline:
+                chunk = chunk.replace(newline[:1], newline)
+            yield chunk_prefix + chunk
+            chunk_prefix = separator
+
+        if chunk_prefix is None:
+            yield self.dumps([], indent=indent)
+        else:
+            yield end
+
+
+class MsgPackRenderer:
+    # Use the C accelerated `msgpack` package, if it is installed.
+    accelerated = msgpack is not None
+
+    def render(self, data, **options):
+        """
+        Render primative data, such as `Serializer.data`, as MessagePack.
+        """
+        if self.accelerated:
+            return msgpack.packb(data, use_bin_type=True, default=encode_default)
+        return binary.msgpack_dumps(data, default=encode_default)
+
+
+def cbor2_default(encoder, value):
+    encoder.encode(encode_default(value))
+
+
+def replace_sets(value):
+    """
+    Return primative data with any sets replaced by lists, as for
+    `encode_default()`, for encoders that would otherwise encode sets
+    natively, such as `cbor2`, which writes them with tag 258.
+    """
+    if isinstance(value, (set, frozenset)):
+        value = encode_default(value)
+    if isinstance(value, (list, tuple)):
+        return [replace_sets(item) for item in value]
+    if isinstance(value, Mapping):
+        return OrderedDict([(key, replace_sets(item)) for key, item in value.items()])
+    return value
+
+
+class CBORRenderer:
+    # Use the C accelerated `cbor2` package, if it is installed.
+    accelerated = cbor2 is not None
+
+    def render(self, data, **options):
+        """
+        Render primative data, such as `Serializer.data`, as CBOR.
+        """
+        if self.accelerated:
+            return cbor2.dumps(replace_sets(data), default=cbor2_default)
+        return binary.cbor_dumps(data, default=encode_default)
+
+
+# A typed column of values.  `values` is an `array` for the 'int64', 'bool'
+# and 'dictionary' types, the UTF-8 encoded `bytes` of every value for the
+# 'string' type, and a list for the 'object' type.  `offsets` is an
+# `array` of where each string starts and ends in `values`, `dictionary` is
+# the list of values that a 'dictionary' column's `values` index into, and
+# `mask` is a `bytearray` with a zero for each null value, or `None`.
+Column = namedtuple('Column', ['name', 'type', 'values', 'mask', 'offsets', 'dictionary'])
+
+
+def get_mask(values):
+    if None not in values:
+        return None
+    return bytearray([value is not None for value in values])
+
+
+def int64_column(name, values, field):
+    if not all(type(value) in integer_types for value in values if value is not None):
+        return None
+    try:
+        column = array('q', [0 if value is None else value for value in values])
+    except OverflowError:
+        return None
+    return Column(name, 'int64', column, get_mask(values), None, None)
+
+
+def bool_column(name, values, field):
+    if not all(value is None or isinstance(value, bool) for value in values):
+        return None
+    column = array('B', [value is True for value in values])
+    return Column(name, 'bool', column, get_mask(values), None, None)
+
+
+def dictionary_column(name, values, field):
+    # Only columns of the choices themselves can be dictionary encoded, and
+    # the choices must all be strings, or all be integers.
+    dictionary = list(field.choices.keys())
+    if not dictionary:
+        return None
+    if not all(isinstance(key, string_types) for key in dictionary):
+        if not all(type(key) in integer_types for key in dictionary):
+            return None
+    indexes = {key: index for index, key in enumerate(dictionary)}
+    column = array('i')
+    try:
+        for value in values:
+            index = 0 if value is None else indexes.get(value)
+            if index is None or (value is not None and type(value) is not type(dictionary[index])):
+                return None
+            column.append(index)
+    except TypeError:
+        return None
+    return Column(name, 'dictionary', column, get_mask(values), None, dictionary)
+
+
+def string_column(name, values, field):
+    if not all(value is None or isinstance(value, string_types) for value in values):
+        return None
+    offsets = array('q', [0])
+    data = bytearray()
+    for value in values:
+        if value is not None:
+            data.extend(binary.encode_text(value))
+        offsets.append(len(data))
+    return Column(name, 'string', bytes(data), get_mask(values), offsets, None)
+
+
+class ColumnarRenderer:
+    """
+    Renders a list serializer's instances as typed columns, driven by the
+    field types of its child serializer, and writes them as an Arrow IPC
+    file or a Parquet file using `pyarrow`.
+    """
+    format = 'arrow'
+
+    # Maps field classes to functions that build a typed column, or return
+    # `None` if the values do not fit that type.  Other fields, and values
+    # that do not fit, are kept as 'object' columns.
+    column_builders = [
+        (MultipleChoiceField, None),
+        (ChoiceField, dictionary_column),
+        (BooleanField, bool_column),
+        (IntegerField, int64_column),
+        (CharField, string_column),
+    ]
+
+    def __init__(self, format=None):
+        self.format = self.format if (format is None) else format
+
+    def get_columns(self, serializer, instances):
+        """
+        Return an ordered dict of field names to typed `Column`s, for
+        serializing the instances with `serializer`.
+        """
+        # Columns are matched to fields by name, as a serializer that
+        # overrides `to_primative()` may add, remove or reorder them.
+        fields = get_fields_by_name(serializer)
+        columns = OrderedDict()
+        for name, values in serializer.to_columns(instances).items():
+            columns[name] = self.get_column(name, values, fields.get(name))
+        return columns
+
+    def get_column(self, name, values, field):
+        for field_class, build in self.column_builders:
+            if isinstance(field, field_class):
+                column = None if build is None else build(name, values, field)
+                if column is not None:
+                    return column
+                break
+        return Column(name, 'object', values, None, None, None)
+
+    def render_serializer(self, serializer, **options):
+        """
+        Render a list serializer's instances as Arrow IPC or Parquet bytes.
+        """
+        instances = list(serializer.instance)
+        table = self.get_table(self.get_columns(serializer.child, instances), len(instances))
+        fmt = options.get('format', self.format)
+        sink = pyarrow.BufferOutputStream()
+        if fmt == 'parquet':
+            import pyarrow.parquet
+            pyarrow.parquet.write_table(table, sink)
+        else:
+            assert fmt == 'arrow', 'Unknown format `{format}`.'.format(format=fmt)
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def get_table(self, columns, length):
+        """
+        Return a `pyarrow.Table` of the columns, using their buffers directly.
+        """
+        if pyarrow is None:
+            raise ImportError('The `pyarrow` package is required to write Arrow or Parquet files.')
+        arrays = [self.get_arrow_array(column, length) for column in columns.values()]
+        return pyarrow.Table.from_arrays(arrays, names=list(columns.keys()))
+
+    def get_arrow_array(self, column, length):
+        if column.mask is None:
+            validity, null_count = None, 0
+        else:
+            validity = pyarrow.py_buffer(pack_bits(column.mask))
+            null_count = len(column.mask) - sum(column.mask)
+        if column.type == 'int64':
+            buffers = [validity, pyarrow.py_buffer(column.values)]
+            return pyarrow.Array.from_buffers(pyarrow.int64(), length, buffers, null_count)
+        if column.type == 'bool':
+            buffers = [validity, pyarrow.py_buffer(pack_bits(column.values))]
+            return pyarrow.Array.from_buffers(pyarrow.bool_(), length, buffers, null_count)
+        if column.type == 'string':
+            buffers = [validity, pyarrow.py_buffer(column.offsets), pyarrow.py_buffer(column.values)]
+            return pyarrow.Array.from_buffers(pyarrow.large_string(), length, buffers, null_count)
+        if column.type == 'dictionary':
+            buffers = [validity, pyarrow.py_buffer(column.values)]
+            indices = pyarrow.Array.from_buffers(pyarrow.int32(), length, buffers, null_count)
+            return pyarrow.DictionaryArray.from_arrays(indices, pyarrow.array(column.dictionary))
+        return pyarrow.array([
+            encode_default(value) if isinstance(value, (set, frozenset)) else value
+            for value in column.values
+        ])
+
+
+def pack_bits(values):
+    """
+    Pack a sequence of truthy values into a bitmap, least significant bit
+    first, as used for Arrow validity and boolean buffers.
+    """
+    bitmap = bytearray((len(values) + 7) // 8)
+    for index, value in enumerate(values):
+        if value:
+            bitmap[index >> 3] |= 1 << (index & 7)
+    return bytes(bitmap)
+
+
+def get_fields_by_name(serializer):
+    """
+    Return a dict of the serializer's readable fields, keyed by field name.
+    """
+    plan = serializer.get_plan('plan', SerializerPlan)
+    return dict(zip(plan.field_names, plan.fields))
+
+
+def get_row_keys(rows):
+    """
+    Return the keys of a list of dicts, in the order they first appear.
+    """
+    return list(OrderedDict((key, None) for row in rows for key in row))
+
+
+class CSVRenderer:
+    """
+    Renders instances as CSV, a chunk of rows at a time, so that only one
+    chunk of instances needs to be held in memory.
+
+    The header row uses each field's label.  Nested serializers are
+    flattened into a column for each of their fields, labelled with both the
+    nested serializer's and the field's labels, such as "Owner Name".  List
+    and dict values are written as JSON.
+
+    Serializers that override `to_primative()` are serialized a row at a
+    time instead, with the columns taken from the keys of the first chunk
+    of rows.
+    """
+    chunk_size = 1000
+    label_separator = ' '
+
+    def __init__(self, chunk_size=None, header=True):
+        self.chunk_size = self.chunk_size if (chunk_size is None) else chunk_size
+        self.header = header
+
+    def get_headers(self, serializer, prefix=''):
+        plan = serializer.get_plan('plan', SerializerPlan)
+        headers = []
+        for field in plan.fields:
+            label = prefix + field.label
+            if is_plain_serializer(field):
+                headers.extend(self.get_headers(field, label + self.label_separator))
+            else:
+                headers.append(label)
+        return headers
+
+    def get_columns(self, serializer, instances):
+        """
+        Serialize a list of instances one column at a time, returning a
+        list of columns with nested serializers flattened.
+        """
+        if not is_plain_serializer(serializer):
+            rows = self.get_rows(serializer, instances)
+            return self.get_row_columns(rows, get_row_keys(rows))
+        plan = serializer.get_plan('plan', SerializerPlan)
+        batch_methods = plan.get_batch_methods(serializer)
+        columns = []
+        for index, (field, (field_name, getter, convert)) in enumerate(zip(plan.fields, plan.get_steps(serializer))):
+            column = instances if getter is None else list(map(getter, instances))
+            if is_plain_serializer(field):
+                columns.extend(self.get_columns(field, column))
+            elif index in batch_methods:
+                columns.append(call_batch_method(batch_methods[index], column))
+            elif convert is None:
+                columns.append(column)
+            else:
+                columns.append(list(map(convert, column)))
+        return [
+            [self.format_value(value) for value in column]
+            if any(isinstance(value, (list, tuple, set, frozenset, Mapping)) for value in column)
+            else column
+            for column in columns
+        ]
+
+    def get_rows(self, serializer, instances):
+        """
+        Serialize a list of instances with `to_primative()`, returning a
+        flattened dict for each row, keyed by tuples of names.
+        """
+        return [self.flatten_row(serializer, serializer.to_primative(instance)) for instance in instances]
+
+    def flatten_row(self, serializer, row, prefix=()):
+        assert isinstance(row, Mapping), ('`CSVRenderer` requires `to_primative()` to return dicts.')
+        fields = get_fields_by_name(serializer)
+        flat = OrderedDict()
+        for name, value in row.items():
+            field = fields.get(name)
+            if is_plain_serializer(field) and isinstance(value, Mapping):
+                flat.update(self.flatten_row(field, value, prefix + (name,)))
+            else:
+                flat[prefix + (name,)] = value
+        return flat
+
+    def get_row_columns(self, rows, keys):
+        return [[self.format_value(row.get(key)) for row in rows] for key in keys]
+
+    def get_row_headers(self, serializer, keys):
+        """
+        Return the header row for the keys of flattened rows, using the
+        labels of the fields that they name.
+        """
+        headers = []
+        for key in keys:
+            labels = []
+            fields = get_fields_by_name(serializer)
+            for name in key:
+                field = fields.get(name)
+                labels.append(str(name) if field is None else field.label)
+                fields = get_fields_by_name(field) if is_plain_serializer(field) else {}
+            headers.append(self.label_separator.join(labels))
+        return headers
+
+    def format_value(self, value):
+        if isinstance(value, (list, tuple, set, frozenset, Mapping)):
+            return stdlib_dumps(value)
+        return value
+
+    def render_iter(self, serializer, instances):
+        """
+        Render an iterable of instances as CSV, yielding the text for the
+        header and then for each chunk of rows.
+
+        `serializer` may be either a serializer class or instance.
+        """
+        if isinstance(serializer, type):
+            serializer = serializer()
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        plain = is_plain_serializer(serializer)
+        if self.header and plain:
+            writer.writerow(self.get_headers(serializer))
+            yield self.take(buffer)
+        keys = None
+        for chunk in iter_chunks(instances, self.chunk_size):
+            if plain:
+                columns = self.get_columns(serializer, chunk)
+            else:
+                rows = self.get_rows(serializer, chunk)
+                if keys is None:
+                    keys = get_row_keys(rows)
+                    if self.header:
+                        writer.writerow(self.get_row_headers(serializer, keys))
+                columns = self.get_row_columns(rows, keys)
+            writer.writerows(zip(*columns))
+            yield self.take(buffer)
+        if self.header and not plain and keys is None:
+            writer.writerow(self.get_headers(serializer))
+            yield self.take(buffer)
+
+    def take(self, buffer):
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    def render_to(self, stream, serializer, instances):
+        """
+        Write an iterable of instances as CSV to a file-like object,
+        flushing it after each chunk of rows.
+        """
+        flush = getattr(stream, 'flush', None)
+        for text in self.render_iter(serializer, instances):
+            stream.write(text)
+            if flush is not None:
+                flush()
+
+    def render_serializer(self, serializer, **options):
+        """
+        Render a list serializer's instances as CSV.
+        """
+        return ''.join(self.render_iter(serializer.child, serializer.instance))
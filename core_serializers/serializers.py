@@ -1,18 +1,525 @@
-from six import add_metaclass
-from collections import OrderedDict, namedtuple
+from six import add_metaclass, get_unbound_function
+from six.moves.collections_abc import Mapping, MutableMapping
+from collections import OrderedDict, deque, namedtuple
 from core_serializers.fields import (
-    SkipField, ValidationError, Field
+    SkipField, ValidationError, BooleanField, CharField, ChoiceField, Field,
+    IntegerField, MethodField, MultipleChoiceField, call_batch_method
 )
 from core_serializers.utils import (
-    BasicObject, parse_html_dict, parse_html_list, empty, is_html_input, set_value
+    BasicObject, parse_html_dict, parse_html_list, empty, get_html_view,
+    is_html_input, iter_chunks, set_value
 )
+from functools import partial
+from itertools import chain
 import copy
+import operator
 
 
 FieldResult = namedtuple('FieldResult', ['field', 'value', 'error'])
+ItemResult = namedtuple('ItemResult', ['index', 'value', 'error'])
+
+
+def is_overridden(field, method_name):
+    """
+    Return `True` if the given field class overrides one of the base
+    `Field` methods, and so cannot be short-circuited by a compiled plan.
+    """
+    method = getattr(type(field), method_name)
+    base_method = getattr(Field, method_name)
+    return get_unbound_function(method) is not get_unbound_function(base_method)
+
+
+def iter_validated(child, items):
+    """
+    Validate each item using `child`, yielding a `(value, error)` pair
+    for each item.
+    """
+    for item in items:
+        try:
+            yield child.validate(item), None
+        except ValidationError as exc:
+            yield None, exc.args[0]
+
+
+def defining_class(field, method_name):
+    """
+    Return the class in a field's hierarchy that defines the given method.
+    """
+    for cls in type(field).__mro__:
+        if method_name in cls.__dict__:
+            return cls
+
+
+def get_list_converter(field):
+    """
+    Return a function that converts a whole list of items at once, if the
+    field validates each item by simply calling `to_native()`, or `None`.
+
+    A field class's `to_native_many()` is not used by subclasses that only
+    override `to_native()`, which convert one item at a time instead.
+    """
+    if isinstance(field, BaseSerializer) or is_overridden(field, 'validate'):
+        return None
+    if issubclass(defining_class(field, 'to_native_many'), defining_class(field, 'to_native')):
+        return field.to_native_many
+    return partial(Field.to_native_many, field)
+
+
+def validate_list(child, items):
+    """
+    Validate a list of items using `child`, raising the first item's error.
+
+    Lists of scalar values are converted all at once, and are only validated
+    one item at a time if that fails, in order to find the invalid item.
+    """
+    convert = get_list_converter(child) if isinstance(items, (list, tuple)) else None
+    if convert is not None:
+        try:
+            return convert(items)
+        except ValidationError:
+            pass
+    return [child.validate(item) for item in items]
+
+
+def validate_chunk(child, items):
+    """
+    Validate a chunk of list items in an executor, which may be running in
+    another process, so both `child` and the results must be picklable.
+    """
+    convert = get_list_converter(child)
+    if convert is not None:
+        try:
+            return [(value, None) for value in convert(items)]
+        except ValidationError:
+            pass
+    return list(iter_validated(child, items))
+
+
+def is_plain_serializer(field):
+    """
+    Return `True` for serializers that do not override `to_primative()`, and
+    so may serialize many instances at once with `to_primative_many()`.
+    """
+    if not isinstance(field, Serializer):
+        return False
+    to_primative = get_unbound_function(type(field).to_primative)
+    return to_primative is get_unbound_function(Serializer.to_primative)
+
+
+def is_plain_list_serializer(field):
+    """
+    Return `True` for list serializers that do not override `to_primative()`.
+    """
+    if not isinstance(field, ListSerializer):
+        return False
+    to_primative = get_unbound_function(type(field).to_primative)
+    return to_primative is get_unbound_function(ListSerializer.to_primative)
+
+
+def has_plain_get_value(field):
+    """
+    Return `True` for fields using one of the built in `get_value()` methods,
+    which look up the field's own name, and only differ in order to handle
+    HTML input.  These may read HTML input through an indexed view.
+    """
+    plain_get_value = set([
+        get_unbound_function(field_class.get_value)
+        for field_class in (
+            Field, BooleanField, MultipleChoiceField, Serializer, ListSerializer
+        )
+    ])
+    return get_unbound_function(type(field).get_value) in plain_get_value
+
+
+def serialize_chunk(child, items):
+    """
+    Serialize a chunk of list items in an executor, which may be running in
+    another process, so both `child` and the results must be picklable.
+    """
+    if is_plain_serializer(child):
+        return child.to_primative_many(items)
+    return [child.to_primative(item) for item in items]
+
+
+def rows_to_columns(rows, field_names):
+    """
+    Convert a list of dicts into an ordered dict of each key to its list
+    of values, with `None` for the rows that are missing a key.  The keys
+    are in the order that they first appear, or are `field_names` if there
+    are no rows.
+    """
+    if not rows:
+        return OrderedDict([(field_name, []) for field_name in field_names])
+    columns = OrderedDict()
+    for row in rows:
+        assert isinstance(row, Mapping), (
+            '`columnar` requires `to_primative()` to return dicts.'
+        )
+        for key in row:
+            if key not in columns:
+                columns[key] = None
+    for key in columns:
+        columns[key] = [row.get(key) for row in rows]
+    return columns
+
+
+def serialize_columns_chunk(child, items):
+    """
+    Serialize a chunk of list items into columns in an executor.
+    """
+    return child.to_columns(items)
+
+
+def is_context_free(field, nested=False):
+    """
+    Return `True` if a field behaves the same whichever serializer it is
+    bound to, so that one bound copy may be shared by every instance of a
+    serializer class.
+
+    Only the built in field classes are known not to use `parent` or `root`.
+    Method fields are looked up on the serializer that is actually being
+    used, which is only possible for a serializer's own fields, and not for
+    those of its `nested` serializers.
+    """
+    field_class = type(field)
+    for method_name in context_free_method_names:
+        method = getattr(field_class, method_name, None)
+        if method is not None and get_unbound_function(method) not in context_free_methods:
+            return False
+    if isinstance(field, MethodField):
+        return not nested
+    if isinstance(field, Serializer):
+        return all(
+            is_context_free(child, nested=True)
+            for child in field.fields.peek().values()
+        )
+    if isinstance(field, ListSerializer):
+        return is_context_free(field.child, nested=True)
+    return True
+
+
+class FieldDict(MutableMapping):
+    """
+    An ordered mapping of field names to field instances, bound to the
+    serializer that owns them.
+
+    The fields are cloned from the `declared` fields of the serializer
+    class the first time that a field is handed out, or the fields are
+    changed, rather than when the serializer is created.  Looking up the
+    field names does not clone them.  Until then, the serializer may use
+    the plans compiled from the fields shared by its class, see
+    `Serializer.get_plan()`.
+
+    Anything that is compiled from the fields, such as the serialization
+    plan, is cached here.  The cache is discarded whenever fields are
+    handed out in a way that allows them to be modified.  A field that is
+    kept and modified after the serializer has been used is not noticed,
+    so look the field up again when modifying it:
+
+        field = serializer.fields['a']
+        serializer.to_primative(instance)
+        field.write_only = True  # The cached plan still includes 'a'.
+        serializer.fields['a'].write_only = True  # Discards the plan.
+    """
+
+    def __init__(self, serializer, declared):
+        self.serializer = serializer
+        self.declared = declared
+        self._fields = None
+        self._cache = {}
+
+    def get_fields(self):
+        """
+        Return the ordered dict of bound fields, cloning them if required.
+
+        This is used to compile cached values, so it does not discard the
+        cache, and the fields must not be modified.
+        """
+        if self._fields is None:
+            self._fields = copy.deepcopy(self.declared)
+            root = getattr(self.serializer, 'root', None) or self.serializer
+            for field_name, field in self._fields.items():
+                field.bind(field_name, self.serializer, root)
+        return self._fields
+
+    def is_cloned(self):
+        """
+        Return `True` once the serializer has its own copy of the fields.
+        """
+        return self._fields is not None
+
+    def peek(self):
+        """
+        Return the fields, without cloning the declared fields if they
+        have not yet been cloned.  The fields must not be modified.
+        """
+        return self.declared if self._fields is None else self._fields
+
+    def cached(self, key, build):
+        """
+        Return the compiled value for `key`, building it from the fields
+        using `build(fields)` if it has not yet been compiled.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build(self)
+            return value
+
+    def get_mutable_fields(self):
+        # The caller may modify the fields that we return.
+        fields = self.get_fields()
+        self._cache.clear()
+        return fields
+
+    def __getitem__(self, key):
+        return self.get_mutable_fields()[key]
+
+    def __setitem__(self, key, field):
+        self.get_mutable_fields()[key] = field
+
+    def __delitem__(self, key):
+        del self.get_mutable_fields()[key]
+
+    def __contains__(self, key):
+        return key in self.peek()
+
+    def __iter__(self):
+        return iter(self.peek())
+
+    def __len__(self):
+        return len(self.peek())
+
+    def keys(self):
+        return self.peek().keys()
+
+    def values(self):
+        return self.get_mutable_fields().values()
+
+    def items(self):
+        return self.get_mutable_fields().items()
+
+    def __getstate__(self):
+        # Compiled plans are not worth pickling, and are simply rebuilt.
+        state = self.__dict__.copy()
+        state['_cache'] = {}
+        return state
+
+    def __deepcopy__(self, memo):
+        ret = FieldDict(copy.deepcopy(self.serializer, memo), self.declared)
+        if self._fields is not None:
+            ret._fields = copy.deepcopy(self._fields, memo)
+        return ret
+
+    def __repr__(self):
+        return '<FieldDict %s>' % list(self.keys())
+
+
+class SerializerPlan(object):
+    """
+    The steps required to serialize an object instance, compiled once from
+    the bound fields rather than being worked out again for every instance.
+
+    Each step is a `(field_name, getter, convert)` tuple, where `getter` is
+    `None` for `source='*'` fields, and `convert` is `None` for fields that
+    do not transform their outgoing values.
+
+    Method fields are resolved against the serializer that is actually
+    being used, so a plan compiled from the fields shared by a serializer
+    class may be used by every instance of that class.  When serializing
+    many instances, a `get_<field_name>_batch(instances)`
+    method is called once for the whole column, in preference to calling
+    `get_<field_name>(instance)` for each instance.
+
+    The field for each step is also kept, in the same order, as `fields`.
+    """
+
+    def __init__(self, fields):
+        method_to_primative = get_unbound_function(MethodField.to_primative)
+        self.fields = []
+        self.steps = []
+        self.method_fields = []
+        self.column_converters = {}
+        for field in fields.get_fields().values():
+            if field.write_only:
+                continue
+            self.fields.append(field)
+            to_primative = get_unbound_function(type(field).to_primative)
+            if is_plain_serializer(field):
+                # Nested serializers can convert a whole column at once.
+                self.column_converters[len(self.steps)] = field.to_primative_many
+            convert = self.get_converter(field)
+            if to_primative is method_to_primative:
+                self.method_fields.append((len(self.steps), field))
+                convert = field.method or convert
+            self.steps.append((field.field_name, self.get_getter(field), convert))
+        self.field_names = [field_name for field_name, getter, convert in self.steps]
+
+        # Method fields are bound to the serializer that owns the fields,
+        # such as the prototype of a serializer class, so other serializers
+        # using the plan need their own set of steps.
+        self.serializer = fields.serializer
+
+    def get_getter(self, field):
+        if is_overridden(field, 'get_attribute'):
+            return field.get_attribute
+        if not field.source_attrs:
+            return None
+        return operator.attrgetter('.'.join(field.source_attrs))
+
+    def get_converter(self, field):
+        if is_overridden(field, 'to_primative'):
+            return field.to_primative
+        return None
+
+    def get_steps(self, serializer):
+        """
+        Return the steps, with any method fields bound to `serializer`.
+
+        When the plan is shared by a serializer class, each instance looks
+        up its methods once, and keeps its own steps.
+        """
+        if not self.method_fields or serializer is self.serializer:
+            return self.steps
+        bound_steps = serializer.__dict__.get('_plan_steps')
+        if bound_steps is not None and bound_steps[0] is self:
+            return bound_steps[1]
+        steps = list(self.steps)
+        for index, field in self.method_fields:
+            method = field.resolve_method(serializer)
+            if method is None:
+                # Fail with the usual error for a missing method.
+                getattr(serializer, field.method_name)
+            field_name, getter, convert = steps[index]
+            steps[index] = (field_name, getter, method)
+        serializer._plan_steps = (self, steps)
+        return steps
+
+    def get_batch_methods(self, serializer):
+        """
+        Return a dict of step index to any batch methods on `serializer`.
+        """
+        batch_methods = {}
+        for index, field in self.method_fields:
+            batch_method = getattr(serializer, field.method_name + '_batch', None)
+            if batch_method is not None:
+                batch_methods[index] = batch_method
+        return batch_methods
+
+    def to_primative(self, instance, serializer):
+        ret = OrderedDict()
+        for field_name, getter, convert in self.get_steps(serializer):
+            value = instance if getter is None else getter(instance)
+            ret[field_name] = value if convert is None else convert(value)
+        return ret
+
+    def to_columns(self, instances, serializer):
+        """
+        Serialize a list of instances one field at a time, returning an
+        ordered dictionary of each field name to its list of values.
+        """
+        batch_methods = self.get_batch_methods(serializer)
+        columns = OrderedDict()
+        for index, (field_name, getter, convert) in enumerate(self.get_steps(serializer)):
+            column = instances if getter is None else list(map(getter, instances))
+            if index in batch_methods:
+                columns[field_name] = call_batch_method(batch_methods[index], column)
+            elif index in self.column_converters:
+                columns[field_name] = self.column_converters[index](column)
+            elif convert is None:
+                columns[field_name] = list(column)
+            else:
+                columns[field_name] = list(map(convert, column))
+        return columns
+
+    def to_primative_many(self, instances, serializer):
+        """
+        Serialize a list of instances column by column, filling in each
+        column of the rows in turn.
+        """
+        field_names = self.field_names
+        rows = [OrderedDict.fromkeys(field_names) for instance in instances]
+        for field_name, column in self.to_columns(instances, serializer).items():
+            for row, value in zip(rows, column):
+                row[field_name] = value
+        return rows
+
+
+class ValidationPlan(object):
+    """
+    The steps required to validate incoming primative data, compiled once
+    from the bound fields rather than being worked out again for every input.
+
+    Each step is a `(field_name, get_value, validate, key, keys)` tuple.
+    For plain dictionary input `get_value` is `None` wherever the field
+    would simply look up its own name.  Validated values are stored under
+    `key` for flat sources, or using `keys` for dotted and `source='*'`
+    sources, in which case `key` is `None`.
+
+    HTML input is read by the built in fields through a view of the whole
+    form, so that its keys are indexed once for all of the nested fields,
+    while fields that override `get_value()` are given the input as it is.
+    """
+
+    def __init__(self, fields):
+        self.steps = []
+        self.html_steps = []
+        self.html_view_steps = set()
+        for field in fields.get_fields().values():
+            if field.read_only:
+                continue
+            keys = field.source_attrs
+            key = keys[0] if len(keys) == 1 else None
+            if has_plain_get_value(field):
+                get_value = None
+                self.html_view_steps.add(len(self.html_steps))
+            else:
+                get_value = field.get_value
+            self.steps.append((field.field_name, get_value, field.validate, key, keys))
+            self.html_steps.append((field.field_name, field.get_value, field.validate, key, keys))
+
+    def to_native(self, data):
+        if is_html_input(data):
+            steps = self.html_steps
+            view = get_html_view(data)
+            view_steps = self.html_view_steps
+        else:
+            steps = self.steps
+            view_steps = ()
+        ret = {}
+        errors = {}
+
+        for index, (field_name, get_value, validate, key, keys) in enumerate(steps):
+            if get_value is None:
+                primitive_value = data.get(field_name, empty)
+            elif index in view_steps:
+                primitive_value = get_value(view)
+            else:
+                primitive_value = get_value(data)
+            try:
+                validated_value = validate(primitive_value)
+            except ValidationError as exc:
+                errors[field_name] = str(exc)
+            except SkipField:
+                pass
+            else:
+                if key is not None:
+                    ret[key] = validated_value
+                else:
+                    set_value(ret, keys, validated_value)
+
+        if errors:
+            raise ValidationError(errors)
+
+        return ret
 
 
 class BaseSerializer(Field):
+    # Set by `.data` and `.is_valid()`.
+    _data = empty
+    _errors = empty
+    _validated_data = empty
+
     def __init__(self, instance=None, data=None, **kwargs):
         super(BaseSerializer, self).__init__(**kwargs)
         self.instance = instance
@@ -24,6 +531,13 @@ class BaseSerializer(Field):
     def to_primative(self, instance):
         raise NotImplementedError()
 
+    def __getstate__(self):
+        # Compiled plans are not worth copying, and are simply rebuilt.
+        state = self.__dict__.copy()
+        state.pop('_plan_steps', None)
+        state.pop('_json_writers', None)
+        return state
+
     def save(self):
         raise NotImplementedError()
 
@@ -39,12 +553,15 @@ class BaseSerializer(Field):
 
     @property
     def data(self):
-        if not hasattr(self, '_data'):
+        if self._data is empty:
             if self.instance is not None:
                 self._data = self.to_primative(self.instance)
             elif self._initial_data is not None:
+                data = self._initial_data
+                # HTML input is indexed once for all of the nested fields.
+                view = get_html_view(data) if is_html_input(data) else data
                 self._data = {
-                    field_name: field.get_value(self._initial_data)
+                    field_name: field.get_value(view if has_plain_get_value(field) else data)
                     for field_name, field in self.fields.items()
                 }
             else:
@@ -53,14 +570,14 @@ class BaseSerializer(Field):
 
     @property
     def errors(self):
-        if not hasattr(self, '_errors'):
+        if self._errors is empty:
             msg = 'You must call `.is_valid()` before accessing `.errors`.'
             raise AssertionError(msg)
         return self._errors
 
     @property
     def validated_data(self):
-        if not hasattr(self, '_validated_data'):
+        if self._validated_data is empty:
             msg = 'You must call `.is_valid()` before accessing `.validated_data`.'
             raise AssertionError(msg)
         return self._validated_data
@@ -101,21 +618,50 @@ class Serializer(BaseSerializer):
     def __init__(self, *args, **kwargs):
         super(Serializer, self).__init__(*args, **kwargs)
 
-        # Every new serializer is created with a clone of the field instances.
+        # Every new serializer gets its own clone of the field instances,
+        # made the first time that they are used.
         # This allows users to dynamically modify the fields on a serializer
         # instance without affecting every other serializer class.
-        self.fields = copy.deepcopy(self._fields)
+        self.fields = FieldDict(self, self._fields)
 
-        # Setup all the child fields, to provide them with the current context.
-        for field_name, field in self.fields.items():
-            field.bind(field_name, self, self)
+    @classmethod
+    def get_shared_fields(cls):
+        """
+        Return the fields of this class bound to a prototype instance, from
+        which plans shared by every instance are compiled, or `None` if the
+        fields might depend on the serializer they are bound to.
+        """
+        try:
+            return cls.__dict__['_shared_fields']
+        except KeyError:
+            shared = None
+            if all(is_context_free(field) for field in cls._fields.values()):
+                prototype = cls.__new__(cls)
+                BaseSerializer.__init__(prototype)
+                shared = prototype.fields = FieldDict(prototype, cls._fields)
+            cls._shared_fields = shared
+            return shared
+
+    def get_plan(self, key, build):
+        """
+        Return the value compiled from the fields by `build(fields)`.
+
+        Until this serializer clones its fields, the value is compiled once
+        from the fields shared by its class, and used by every instance.
+        """
+        fields = self.fields
+        if not fields.is_cloned():
+            fields = type(self).get_shared_fields() or fields
+        return fields.cached(key, build)
 
     def bind(self, field_name, parent, root):
         # If the serializer is used as a field then when it becomes bound
-        # it also needs to bind all its child fields.
+        # it also needs to bind all its child fields.  Fields that have not
+        # been cloned yet are bound when they are.
         super(Serializer, self).bind(field_name, parent, root)
-        for field_name, field in self.fields.items():
-            field.bind(field_name, self, root)
+        if self.fields.is_cloned():
+            for field_name, field in self.fields.items():
+                field.bind(field_name, self, root)
 
     def get_initial(self):
         return {
@@ -134,38 +680,48 @@ class Serializer(BaseSerializer):
         """
         Dict of native values <- Dict of primitive datatypes.
         """
-        ret = {}
-        errors = {}
-        fields = [field for field in self.fields.values() if not field.read_only]
+        plan = self.get_plan('validation_plan', ValidationPlan)
+        return plan.to_native(data)
 
-        for field in fields:
-            primitive_value = field.get_value(data)
-            try:
-                validated_value = field.validate(primitive_value)
-            except ValidationError as exc:
-                errors[field.field_name] = str(exc)
-            except SkipField:
-                pass
-            else:
-                set_value(ret, field.source_attrs, validated_value)
+    def to_primative(self, instance):
+        """
+        Object instance -> Dict of primitive datatypes.
+        """
+        plan = self.get_plan('plan', SerializerPlan)
+        return plan.to_primative(instance, self)
 
-        if errors:
-            raise ValidationError(errors)
+    def ato_primative(self, instance, concurrency=None):
+        """
+        Object instance -> Awaitable dict of primitive datatypes.
 
-        return ret
+        Awaitable attribute values and `async def get_<field_name>` methods
+        are awaited concurrently, with at most `concurrency` awaited at once.
+        """
+        from core_serializers.aio import limit_concurrency, serializer_to_primative
+        return limit_concurrency(serializer_to_primative, self, instance, concurrency)
 
-    def to_primative(self, instance):
+    def to_primative_many(self, instances):
         """
-        Object instance -> Dict of primitive datatypes.
+        List of object instances -> List of dicts of primitive datatypes.
+
+        Equivalent to calling `to_primative()` for each instance, but works
+        through the instances one field at a time.
         """
-        ret = OrderedDict()
-        fields = [field for field in self.fields.values() if not field.write_only]
+        plan = self.get_plan('plan', SerializerPlan)
+        return plan.to_primative_many(list(instances), self)
 
-        for field in fields:
-            native_value = field.get_attribute(instance)
-            ret[field.field_name] = field.to_primative(native_value)
+    def to_columns(self, instances):
+        """
+        List of object instances -> Dict of lists of primitive datatypes.
 
-        return ret
+        Serializers that override `to_primative()` serialize each instance
+        with it, and then split the rows into columns.
+        """
+        plan = self.get_plan('plan', SerializerPlan)
+        if not is_plain_serializer(self):
+            rows = [self.to_primative(instance) for instance in instances]
+            return rows_to_columns(rows, plan.field_names)
+        return plan.to_columns(list(instances), self)
 
     def update(self, instance, validated_data):
         for key, value in validated_data.items():
@@ -181,22 +737,57 @@ class Serializer(BaseSerializer):
         return self.instance
 
     def __iter__(self):
-        errors = self.errors if hasattr(self, '_errors') else {}
-        for field in self.fields.values():
-            value = self.data.get(field.field_name) if self.data else None
-            error = errors.get(field.field_name)
-            yield FieldResult(field, value, error)
+        return iter(self.get_field_results())
+
+    def get_field_results(self):
+        """
+        Return a `FieldResult` for every field, looking up the data and
+        errors once rather than once per field.
+        """
+        data = self.data or {}
+        errors = {} if self._errors is empty else self._errors
+        field_items = self.fields.cached('field_items', lambda fields: list(fields.get_fields().items()))
+        return [
+            FieldResult(field, data.get(field_name), errors.get(field_name))
+            for field_name, field in field_items
+        ]
+
+    @classmethod
+    def iter_many(cls, serializers):
+        """
+        Yield the list of field results for each of many bound serializers,
+        such as the forms in a formset.
+        """
+        for serializer in serializers:
+            yield serializer.get_field_results()
 
 
 class ListSerializer(BaseSerializer):
     child = None
     initial = []
+    columnar = False
+    allow_partial = False
+    executor = None
+    chunk_size = 1000
+    max_pending_chunks = 8
 
     def __init__(self, *args, **kwargs):
-        self.child = kwargs.pop('child', copy.deepcopy(self.child))
-        assert self.child is not None, '`child` is a required argument.'
+        child = kwargs.pop('child', None)
+        self.columnar = kwargs.pop('columnar', self.columnar)
+        self.allow_partial = kwargs.pop('allow_partial', self.allow_partial)
+        self.executor = kwargs.pop('executor', self.executor)
+        self.chunk_size = kwargs.pop('chunk_size', self.chunk_size)
+        assert child is not None or self.child is not None, (
+            '`child` is a required argument.'
+        )
         super(ListSerializer, self).__init__(*args, **kwargs)
+        # A child declared on the class is cloned for every new list
+        # serializer, in the same way as the fields of a serializer.
+        self.child = copy.deepcopy(self.child) if child is None else child
         self.child.bind('', self, self)
+        assert not self.columnar or isinstance(self.child, Serializer), (
+            '`columnar` requires the child to be a `Serializer`.'
+        )
 
     def bind(self, field_name, parent, root):
         # If the list is used as a field then it needs to provide
@@ -218,13 +809,154 @@ class ListSerializer(BaseSerializer):
         if is_html_input(data):
             data = parse_html_list(data)
 
-        return [self.child.validate(item) for item in data]
+        if self.executor is None:
+            return validate_list(self.child, data)
+
+        ret = []
+        for index, value, error in self.iter_native(data, max_errors=1):
+            if error is not None:
+                raise ValidationError(error)
+            ret.append(value)
+        return ret
+
+    def is_valid(self):
+        """
+        If `allow_partial` is set then every item is validated, `errors` is
+        a dict of each invalid item's index to its error, and
+        `validated_data` is the list of valid items.
+        """
+        if not self.allow_partial:
+            return super(ListSerializer, self).is_valid()
+
+        self._validated_data = []
+        self._errors = {}
+        for index, value, error in self.iter_native(self._initial_data):
+            if error is None:
+                self._validated_data.append(value)
+            else:
+                self._errors[index] = error
+        return not self._errors
+
+    def iter_native(self, data, max_errors=None):
+        """
+        Iterable of primitive datatypes -> Iterator of `ItemResult`s.
+
+        Items are validated one at a time as they are consumed, so `data`
+        may be any iterable, such as `iter_json_array(stream)`.  Each result
+        has either a validated `value` or an `error`.  If `max_errors` is
+        set, then iteration stops after that many invalid items.
+
+        If `executor` is set, then chunks of `chunk_size` items are
+        validated in the executor, with the results still in order.
+        """
+        if is_html_input(data):
+            data = parse_html_list(data)
+
+        if self.executor is None:
+            if isinstance(data, list) and get_list_converter(self.child) is not None:
+                # The list is already in memory, so convert it in chunks.
+                chunks = iter_chunks(data, self.chunk_size)
+                results = chain.from_iterable(
+                    validate_chunk(self.child, chunk) for chunk in chunks
+                )
+            else:
+                results = iter_validated(self.child, data)
+        else:
+            results = chain.from_iterable(self.map_chunks(validate_chunk, data))
+
+        error_count = 0
+        for index, (value, error) in enumerate(results):
+            yield ItemResult(index, value, error)
+            if error is not None:
+                error_count += 1
+                if error_count == max_errors:
+                    return
+
+    def map_chunks(self, func, data):
+        """
+        Call `func(child, chunk)` in the executor for each chunk of `data`,
+        yielding the results in order.  Only a limited number of chunks are
+        submitted ahead of the results being consumed.
+        """
+        child = self.get_detached_child()
+        pending = deque()
+        try:
+            for chunk in iter_chunks(data, self.chunk_size):
+                pending.append(self.executor.submit(func, child, chunk))
+                if len(pending) >= self.max_pending_chunks:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def get_detached_child(self):
+        """
+        Return a copy of the child with its `parent` and `root` cleared, so
+        that it can be sent to an executor in another process without also
+        sending this list serializer, its executor and all of its data.
+        """
+        memo = {id(self): None, id(getattr(self, 'root', self)): None}
+        return copy.deepcopy(self.child, memo)
 
     def to_primative(self, data):
         """
         List of object instances -> List of dicts of primitive datatypes.
+
+        If `columnar` is set, then instead returns a dict of lists of
+        primitive datatypes, keyed by field name.
+
+        If `executor` is set, then chunks of `chunk_size` items are
+        serialized in the executor, and reassembled in order.
+        """
+        if self.executor is not None:
+            if not self.columnar:
+                return list(chain.from_iterable(self.map_chunks(serialize_chunk, data)))
+            columns = None
+            for chunk in self.map_chunks(serialize_columns_chunk, data):
+                if columns is None:
+                    columns = chunk
+                else:
+                    for field_name, column in chunk.items():
+                        columns[field_name].extend(column)
+            return self.child.to_columns([]) if columns is None else columns
+
+        if self.columnar:
+            return self.child.to_columns(data)
+        return serialize_chunk(self.child, data)
+
+    def ato_primative(self, data, concurrency=None):
+        """
+        List of object instances -> Awaitable list of primitive datatypes.
+
+        Awaitable values are awaited concurrently across all of the items,
+        with at most `concurrency` awaited at once.
+        """
+        from core_serializers.aio import limit_concurrency, list_to_primative
+        return limit_concurrency(list_to_primative, self, data, concurrency)
+
+    def iter_primative(self, data=None):
         """
-        return [self.child.to_primative(item) for item in data]
+        Iterable of object instances -> Iterator of primitive datatypes.
+
+        Items are serialized one at a time as they are consumed, so `data`
+        may be any iterable, such as a generator or a database cursor.
+        Defaults to serializing `instance`.
+
+        If `executor` is set, then chunks of `chunk_size` items are
+        serialized ahead of being consumed.
+        """
+        if data is None:
+            data = self.instance
+        if self.executor is not None:
+            for chunk in self.map_chunks(serialize_chunk, data):
+                for item in chunk:
+                    yield item
+            return
+        to_primative = self.child.to_primative
+        for item in data:
+            yield to_primative(item)
 
     def create(self, attrs_list):
         return [BasicObject(**attrs) for attrs in attrs_list]
@@ -234,3 +966,23 @@ class ListSerializer(BaseSerializer):
             self.update(self.instance, self.validated_data)
         self.instance = self.create(self.validated_data)
         return self.instance
+
+
+# The methods that fields use to serialize and validate values, and the
+# versions of them defined by the built in field classes, which do not
+# depend on the serializer that a field is bound to.
+context_free_method_names = (
+    'bind', 'get_value', 'get_attribute', 'get_default', 'get_initial',
+    'validate', 'to_native', 'to_native_many', 'to_primative',
+    'to_primative_many', 'to_columns', 'iter_native', 'iter_primative',
+    'map_chunks', 'get_plan', 'fail'
+)
+context_free_methods = set([
+    get_unbound_function(getattr(field_class, method_name))
+    for field_class in (
+        Field, BooleanField, CharField, ChoiceField, MultipleChoiceField,
+        IntegerField, MethodField, BaseSerializer, Serializer, ListSerializer
+    )
+    for method_name in context_free_method_names
+    if hasattr(field_class, method_name)
+])
@@ -1,3 +1,6 @@
+from six.moves.collections_abc import Mapping
+import codecs
+import json
 import re
 
 
@@ -68,6 +71,131 @@ def set_value(dictionary, keys, value):
     dictionary[keys[-1]] = value
 
 
+def iter_chunks(iterable, size):
+    """
+    Split any iterable into lists of up to `size` items.
+
+    iter_chunks(range(5), 2) -> [0, 1], [2, 3], [4]
+    """
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class HTMLDictView(Mapping):
+    """
+    A read-only view of some of the keys in a MultiDict, renamed, which
+    reads values directly from the MultiDict rather than copying them.
+
+    Used for the nested dictionaries in HTML form input, so that they keep
+    any multiple values for each key.
+
+    HTMLDictView(data, {'name': 'profile.name'})['name'] -> data['profile.name']
+
+    The keys of a view do not change once it has been parsed, so the index
+    of its keys is built once, see `get_html_index()`.
+    """
+
+    def __init__(self, source, keys_map):
+        self.source = source
+        self.keys_map = keys_map
+        self.index = None
+
+    def __getitem__(self, key):
+        return self.source[self.keys_map[key]]
+
+    def getlist(self, key):
+        if key not in self.keys_map:
+            return []
+        return self.source.getlist(self.keys_map[key])
+
+    def __contains__(self, key):
+        return key in self.keys_map
+
+    def __iter__(self):
+        return iter(self.keys_map)
+
+    def __len__(self):
+        return len(self.keys_map)
+
+    def __repr__(self):
+        return '<HTMLDictView %s>' % dict(self.items())
+
+
+def get_html_view(dictionary):
+    """
+    Return a view of every key in a MultiDict, which is used when parsing a
+    whole form, so that the keys are indexed once for every nested field,
+    rather than being scanned again for each of them.
+    """
+    if isinstance(dictionary, HTMLDictView):
+        return dictionary
+    return HTMLDictView(dictionary, {key: key for key in dictionary})
+
+
+def get_html_source(dictionary):
+    """
+    Return the MultiDict that a dictionary reads its values from, and a
+    function that maps the dictionary's keys to the MultiDict's keys, so that
+    views of views read directly from the original MultiDict.
+    """
+    if isinstance(dictionary, HTMLDictView):
+        return dictionary.source, dictionary.keys_map.__getitem__
+    return dictionary, lambda key: key
+
+
+html_prefix_re = re.compile(r'[.\[]')
+html_list_re = re.compile(r'^\[([0-9]+)\](.*)$')
+html_dict_re = re.compile(r'^\.(.+)$')
+
+
+def get_html_index(dictionary):
+    """
+    Return the keys of a MultiDict, grouped by the prefix before their first
+    `.` or `[`, as a dict of `{prefix: [(key, rest of key), ...]}`.
+
+    {'a.b': 1, 'a[0]': 2, 'c': 3} -> {
+        'a': [('a.b', '.b'), ('a[0]', '[0]')],
+        'c': [('c', '')]
+    }
+
+    The index of an `HTMLDictView` is kept on the view, and reused.
+    """
+    if isinstance(dictionary, HTMLDictView) and dictionary.index is not None:
+        return dictionary.index
+
+    index = {}
+    for field in dictionary:
+        match = html_prefix_re.search(field)
+        split = len(field) if match is None else match.start()
+        index.setdefault(field[:split], []).append((field, field[split:]))
+
+    if isinstance(dictionary, HTMLDictView):
+        dictionary.index = index
+    return index
+
+
+def get_html_entries(dictionary, prefix):
+    """
+    Return `(key, rest of key)` for the keys in a MultiDict that may be
+    nested under `prefix`.
+
+    Only views are indexed.  Other dictionaries may be modified between
+    lookups, so their keys are scanned, as are those of nested prefixes.
+    """
+    if not isinstance(dictionary, HTMLDictView) or html_prefix_re.search(prefix):
+        return [
+            (field, field[len(prefix):])
+            for field in dictionary if field.startswith(prefix)
+        ]
+    return get_html_index(dictionary).get(prefix, ())
+
+
 def parse_html_list(dictionary, prefix=''):
     """
     Used to suport list values in HTML forms.
@@ -100,22 +228,23 @@ def parse_html_list(dictionary, prefix=''):
         {'foo': 'abc', 'bar': 'def'},
         {'foo': 'hij', 'bar': 'klm'}
     ]
+
+    The dictionaries are `HTMLDictView`s of the original MultiDict.
     """
-    Dict = type(dictionary)
+    source, source_key = get_html_source(dictionary)
     ret = {}
-    regex = re.compile(r'^%s\[([0-9]+)\](.*)$' % re.escape(prefix))
-    for field, value in dictionary.items():
-        match = regex.match(field)
+    for field, rest in get_html_entries(dictionary, prefix):
+        match = html_list_re.match(rest)
         if not match:
             continue
         index, key = match.groups()
         index = int(index)
         if not key:
-            ret[index] = value
-        elif isinstance(ret.get(index), dict):
-            ret[index][key] = value
+            ret[index] = dictionary[field]
+        elif isinstance(ret.get(index), HTMLDictView):
+            ret[index].keys_map[key] = source_key(field)
         else:
-            ret[index] = Dict({key: value})
+            ret[index] = HTMLDictView(source, {key: source_key(field)})
     return [ret[item] for item in sorted(ret.keys())]
 
 
@@ -134,13 +263,104 @@ def parse_html_dict(dictionary, prefix):
             'email': 'example@example.com'
         }
     }
+
+    The dictionary is an `HTMLDictView` of the original MultiDict.
     """
-    ret = {}
-    regex = re.compile(r'^%s\.(.+)$' % re.escape(prefix))
-    for field, value in dictionary.items():
-        match = regex.match(field)
+    source, source_key = get_html_source(dictionary)
+    keys_map = {}
+    for field, rest in get_html_entries(dictionary, prefix):
+        match = html_dict_re.match(rest)
         if not match:
             continue
         key = match.groups()[0]
-        ret[key] = value
-    return ret
+        keys_map[key] = source_key(field)
+    return HTMLDictView(source, keys_map)
+
+
+# The longest text that may be the start of a value that continues in the
+# next chunk, other than a string, as for "-Infinity".
+max_partial_length = len('-Infinity')
+
+
+def may_be_truncated(text, position, exc=None):
+    """
+    Return `True` if a JSON value that failed to decode, or that was not
+    followed by a delimiter, at `position` may simply continue in the next
+    chunk, rather than being invalid.
+    """
+    if exc is not None:
+        if getattr(exc, 'msg', '').startswith('Unterminated string'):
+            return True
+        position = getattr(exc, 'pos', position)
+    return len(text) - position <= max_partial_length
+
+
+def iter_json_array(stream, chunk_size=65536):
+    """
+    Incrementally parse a JSON array from a file-like object, yielding each
+    item as soon as it has been read, without loading the whole array.
+
+    The stream may return either text or UTF-8 encoded bytes.
+    """
+    decoder = json.JSONDecoder()
+    utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def read_more():
+        # Keep reading if a chunk ends part way through a character.
+        while True:
+            chunk = stream.read(chunk_size)
+            if not isinstance(chunk, bytes):
+                return chunk
+            decoded = utf8_decoder.decode(chunk, final=not chunk)
+            if decoded or not chunk:
+                return decoded
+
+    text, position, eof = '', 0, False
+    state = 'start'
+    while True:
+        while position < len(text) and text[position] in ' \t\n\r':
+            position += 1
+        if position == len(text):
+            if eof:
+                raise ValueError('Unexpected end of JSON array.')
+            chunk = read_more()
+            eof = not chunk
+            text, position = chunk, 0
+            continue
+
+        char = text[position]
+        if state == 'start':
+            if char != '[':
+                raise ValueError('Expected a JSON array.')
+            position += 1
+            state = 'first'
+        elif state == 'separator' or (state == 'first' and char == ']'):
+            if char == ']':
+                return
+            if char != ',':
+                raise ValueError("Expected ',' or ']' in JSON array.")
+            position += 1
+            state = 'item'
+        else:
+            try:
+                item, end = decoder.raw_decode(text, position)
+            except ValueError as exc:
+                # Only read more if the error may be due to the item
+                # continuing in the next chunk, so invalid input fails fast.
+                if eof or not may_be_truncated(text, position, exc):
+                    raise
+                end = len(text)
+            delimiter = end
+            while delimiter < len(text) and text[delimiter] in ' \t\n\r':
+                delimiter += 1
+            delimited = text[delimiter:delimiter + 1] in (',', ']')
+            if not eof and not delimited and may_be_truncated(text, end):
+                # The item may continue in the next chunk, eg. a number
+                # that has been split in two, so read more and try again.
+                chunk = read_more()
+                eof = not chunk
+                text, position = text[position:] + chunk, 0
+                continue
+            yield item
+            position = end
+            state = 'separator'
@@ -0,0 +1,183 @@
+from core_serializers import fields, serializers
+from core_serializers.utils import BasicObject
+import asyncio
+
+
+class Lookups:
+    """
+    Tracks how many lookups are running at once.
+    """
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def lookup(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return value
+
+
+class TestAsyncSerializer:
+    def setup(self):
+        lookups = self.lookups = Lookups()
+
+        class NestedSerializer(serializers.Serializer):
+            b = fields.IntegerField()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.IntegerField()
+            nested = NestedSerializer()
+            method = fields.MethodField()
+            items = serializers.ListSerializer(child=fields.IntegerField())
+
+            async def get_method(self, instance):
+                return await lookups.lookup(instance.id * 2)
+
+        self.Serializer = TestSerializer
+
+    def make_object(self, a):
+        lookup = self.lookups.lookup
+        return BasicObject(
+            id=a,
+            a=lookup(a),
+            nested=lookup(BasicObject(b=lookup(a + 1))),
+            items=[a, a + 1]
+        )
+
+    def test_serialize(self):
+        """
+        Awaitable attributes and async methods are awaited.
+        """
+        serializer = self.Serializer()
+        data = asyncio.run(serializer.ato_primative(self.make_object(1)))
+        assert list(data.items()) == [
+            ('a', 1), ('nested', {'b': 2}), ('method', 2), ('items', [1, 2])
+        ]
+        assert self.lookups.max_running == 3
+
+    def test_serialize_list(self):
+        serializer = serializers.ListSerializer(child=self.Serializer())
+        objects = [self.make_object(idx) for idx in range(5)]
+        data = asyncio.run(serializer.ato_primative(objects))
+        assert [item['method'] for item in data] == [0, 2, 4, 6, 8]
+        assert self.lookups.max_running == 15
+
+    def test_concurrency_limit(self):
+        serializer = serializers.ListSerializer(child=self.Serializer())
+        objects = [self.make_object(idx) for idx in range(5)]
+        data = asyncio.run(serializer.ato_primative(objects, concurrency=3))
+        assert [item['nested'] for item in data] == [{'b': idx + 1} for idx in range(5)]
+        assert self.lookups.max_running == 3
+
+    def test_synchronous_values(self):
+        serializer = self.Serializer()
+        obj = BasicObject(id=1, a=1, nested=BasicObject(b=2), items=[])
+        data = asyncio.run(serializer.ato_primative(obj))
+        assert data['a'] == 1
+        assert data['nested'] == {'b': 2}
+
+    def test_dotted_source(self):
+        """
+        Awaitable objects along a dotted source are awaited in turn.
+        """
+        lookup = self.lookups.lookup
+
+        class TestSerializer(serializers.Serializer):
+            name = fields.CharField(source='owner.name')
+            city = fields.CharField(source='owner.address.city')
+
+        class Owner(object):
+            name = 'example'
+
+            @property
+            def address(self):
+                return lookup(BasicObject(city=lookup('London')))
+
+        class Pet(object):
+            @property
+            def owner(self):
+                return lookup(Owner())
+
+        obj = Pet()
+        data = asyncio.run(TestSerializer().ato_primative(obj, concurrency=1))
+        assert data == {'name': 'example', 'city': 'London'}
+
+        obj = BasicObject(owner=BasicObject(name='example', address=BasicObject(city='London')))
+        data = asyncio.run(TestSerializer().ato_primative(obj))
+        assert data == {'name': 'example', 'city': 'London'}
+
+    def test_overridden_to_primative(self):
+        """
+        Serializers that override `to_primative()` use it, as for `.data`.
+        """
+        lookup = self.lookups.lookup
+
+        class CustomSerializer(serializers.Serializer):
+            n = fields.CharField()
+
+            def to_primative(self, instance):
+                return 'custom'
+
+        class CustomListSerializer(serializers.ListSerializer):
+            child = fields.IntegerField()
+
+            def to_primative(self, data):
+                return 'custom list'
+
+        class TestSerializer(serializers.Serializer):
+            c = CustomSerializer()
+            d = CustomSerializer()
+            items = serializers.ListSerializer(child=CustomSerializer())
+            numbers = CustomListSerializer()
+
+        nested = BasicObject(n='z')
+        obj = BasicObject(c=nested, d=lookup(nested), items=[nested], numbers=[1])
+        expected = {
+            'c': 'custom', 'd': 'custom', 'items': ['custom'], 'numbers': 'custom list'
+        }
+        assert asyncio.run(TestSerializer().ato_primative(obj)) == expected
+        assert asyncio.run(CustomSerializer().ato_primative(nested)) == 'custom'
+        list_serializer = serializers.ListSerializer(child=CustomSerializer())
+        assert asyncio.run(list_serializer.ato_primative([nested])) == ['custom']
+        assert asyncio.run(CustomListSerializer().ato_primative([1])) == 'custom list'
+
+    def test_columnar(self):
+        serializer = serializers.ListSerializer(child=self.Serializer(), columnar=True)
+        objects = [self.make_object(idx) for idx in range(3)]
+        data = asyncio.run(serializer.ato_primative(objects))
+        assert data['a'] == [0, 1, 2]
+        assert data['method'] == [0, 2, 4]
+        assert list(data.keys()) == ['a', 'nested', 'method', 'items']
+        assert asyncio.run(serializer.ato_primative([])) == serializer.to_primative([])
+
+    def test_batch_methods(self):
+        """
+        Batch methods are called once for a list, as for `to_primative()`,
+        and may be async.
+        """
+        calls = []
+
+        class TestSerializer(serializers.Serializer):
+            m = fields.MethodField()
+            n = fields.MethodField()
+
+            def get_m(self, instance):
+                calls.append('m')
+                return instance.a * 2
+
+            def get_m_batch(self, instances):
+                calls.append('m_batch')
+                return [instance.a * 3 for instance in instances]
+
+            async def get_n_batch(self, instances):
+                calls.append('n_batch')
+                return [instance.a + 1 for instance in instances]
+
+        serializer = serializers.ListSerializer(child=TestSerializer())
+        objects = [BasicObject(a=idx) for idx in range(3)]
+        data = asyncio.run(serializer.ato_primative(objects))
+        assert data == [{'m': 0, 'n': 1}, {'m': 3, 'n': 2}, {'m': 6, 'n': 3}]
+        assert sorted(calls) == ['m_batch', 'n_batch']
@@ -0,0 +1,147 @@
+from core_serializers import binary
+from collections import OrderedDict
+import math
+import pytest
+
+
+class TestMsgPack:
+    # Examples of each type, and their MessagePack encoding.
+    examples = [
+        (None, b'\xc0'),
+        (False, b'\xc2'),
+        (True, b'\xc3'),
+        (0, b'\x00'),
+        (127, b'\x7f'),
+        (128, b'\xcc\x80'),
+        (256, b'\xcd\x01\x00'),
+        (65536, b'\xce\x00\x01\x00\x00'),
+        (2 ** 32, b'\xcf\x00\x00\x00\x01\x00\x00\x00\x00'),
+        (-1, b'\xff'),
+        (-32, b'\xe0'),
+        (-33, b'\xd0\xdf'),
+        (-129, b'\xd1\xff\x7f'),
+        (-2 ** 31, b'\xd2\x80\x00\x00\x00'),
+        (-2 ** 63, b'\xd3\x80\x00\x00\x00\x00\x00\x00\x00'),
+        (1.5, b'\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00'),
+        (u'', b'\xa0'),
+        (u'caf\xe9', b'\xa5caf\xc3\xa9'),
+        (u'x' * 32, b'\xd9\x20' + b'x' * 32),
+        (u'x' * 256, b'\xda\x01\x00' + b'x' * 256),
+        (b'\x00\x01', b'\xc4\x02\x00\x01'),
+        ([], b'\x90'),
+        ([1, [2]], b'\x92\x01\x91\x02'),
+        (list(range(16)), b'\xdc\x00\x10' + bytes(bytearray(range(16)))),
+        ({}, b'\x80'),
+        (OrderedDict([(u'a', 1), (u'b', None)]), b'\x82\xa1a\x01\xa1b\xc0'),
+    ]
+
+    def test_dumps(self):
+        for value, encoded in self.examples:
+            assert binary.msgpack_dumps(value) == encoded, value
+
+    def test_loads(self):
+        for value, encoded in self.examples:
+            assert binary.msgpack_loads(encoded) == value, encoded
+
+    def test_float32(self):
+        assert binary.msgpack_loads(b'\xca\x3f\xc0\x00\x00') == 1.5
+
+    def test_default(self):
+        assert binary.msgpack_dumps(set([1]), default=list) == b'\x91\x01'
+        with pytest.raises(TypeError):
+            binary.msgpack_dumps(set([1]))
+
+    def test_invalid(self):
+        for encoded in (b'', b'\x92\x01', b'\xa5ca', b'\x01\x02', b'\xc1'):
+            with pytest.raises(ValueError):
+                binary.msgpack_loads(encoded)
+
+    def test_nested_too_deeply(self):
+        assert binary.msgpack_loads(b'\x91' * 100 + b'\x90') is not None
+        for encoded in (b'\x91' * 100000 + b'\x90', b'\x81\x01' * 100000 + b'\x80'):
+            with pytest.raises(ValueError):
+                binary.msgpack_loads(encoded)
+        with pytest.raises(ValueError):
+            binary.msgpack_loads(b'\x91' * 10 + b'\x90', max_depth=10)
+
+    def test_unhashable_key(self):
+        with pytest.raises(ValueError):
+            binary.msgpack_loads(b'\x81\x91\x01\x02')
+
+
+class TestCBOR:
+    # Examples from RFC 8949, Appendix A.
+    examples = [
+        (0, b'\x00'),
+        (23, b'\x17'),
+        (24, b'\x18\x18'),
+        (1000, b'\x19\x03\xe8'),
+        (1000000, b'\x1a\x00\x0f\x42\x40'),
+        (1000000000000, b'\x1b\x00\x00\x00\xe8\xd4\xa5\x10\x00'),
+        (18446744073709551616, b'\xc2\x49\x01\x00\x00\x00\x00\x00\x00\x00\x00'),
+        (-18446744073709551617, b'\xc3\x49\x01\x00\x00\x00\x00\x00\x00\x00\x00'),
+        (-1, b'\x20'),
+        (-1000, b'\x39\x03\xe7'),
+        (1.1, b'\xfb\x3f\xf1\x99\x99\x99\x99\x99\x9a'),
+        (False, b'\xf4'),
+        (True, b'\xf5'),
+        (None, b'\xf6'),
+        (b'\x01\x02\x03\x04', b'\x44\x01\x02\x03\x04'),
+        (u'', b'\x60'),
+        (u'\xfc', b'\x62\xc3\xbc'),
+        ([1, [2, 3], [4, 5]], b'\x83\x01\x82\x02\x03\x82\x04\x05'),
+        (list(range(1, 26)), b'\x98\x19' + bytes(bytearray(range(1, 24))) + b'\x18\x18\x18\x19'),
+        ({u'a': 1, u'b': [2, 3]}, b'\xa2\x61\x61\x01\x61\x62\x82\x02\x03'),
+    ]
+
+    def test_dumps(self):
+        for value, encoded in self.examples:
+            assert binary.cbor_dumps(value) == encoded, value
+
+    def test_loads(self):
+        for value, encoded in self.examples:
+            assert binary.cbor_loads(encoded) == value, encoded
+
+    def test_loads_floats(self):
+        assert binary.cbor_loads(b'\xf9\x3c\x00') == 1.0
+        assert binary.cbor_loads(b'\xf9\x80\x00') == 0.0
+        assert binary.cbor_loads(b'\xf9\x00\x01') == 5.960464477539063e-8
+        assert binary.cbor_loads(b'\xf9\x7c\x00') == float('inf')
+        assert math.isnan(binary.cbor_loads(b'\xf9\x7e\x00'))
+        assert binary.cbor_loads(b'\xfa\x47\xc3\x50\x00') == 100000.0
+
+    def test_loads_indefinite(self):
+        assert binary.cbor_loads(b'\x9f\x01\x82\x02\x03\xff') == [1, [2, 3]]
+        assert binary.cbor_loads(b'\xbf\x61\x61\x01\xff') == {u'a': 1}
+        assert binary.cbor_loads(b'\x7f\x65strea\x64ming\xff') == u'streaming'
+        assert binary.cbor_loads(b'\x5f\x42\x01\x02\x41\x03\xff') == b'\x01\x02\x03'
+
+    def test_loads_tags(self):
+        # A date/time string, tag 0, is returned untagged.
+        assert binary.cbor_loads(b'\xc0\x642013') == u'2013'
+
+    def test_invalid(self):
+        for encoded in (b'', b'\x82\x01', b'\x63ab', b'\x01\x02', b'\x1c'):
+            with pytest.raises(ValueError):
+                binary.cbor_loads(encoded)
+
+    def test_invalid_break(self):
+        for encoded in (b'\xff', b'\x81\xff', b'\xa1\x01\xff', b'\xc0\xff'):
+            with pytest.raises(ValueError):
+                binary.cbor_loads(encoded)
+
+    def test_invalid_indefinite_chunks(self):
+        for encoded in (b'\x7f\x01\xff', b'\x5f\x61\x61\xff', b'\x7f\x7f\xff\xff', b'\x7f\x61\x61'):
+            with pytest.raises(ValueError):
+                binary.cbor_loads(encoded)
+
+    def test_nested_too_deeply(self):
+        assert binary.cbor_loads(b'\x81' * 100 + b'\x80') is not None
+        for encoded in (b'\x81' * 100000 + b'\x80', b'\x9f' * 100000, b'\xc0' * 100000 + b'\x00'):
+            with pytest.raises(ValueError):
+                binary.cbor_loads(encoded)
+
+    def test_unhashable_key(self):
+        for encoded in (b'\xa1\x81\x01\x02', b'\xbf\x81\x01\x02\xff'):
+            with pytest.raises(ValueError):
+                binary.cbor_loads(encoded)
@@ -80,7 +80,9 @@ class TestChoiceFieldWithType(ValidAndInvalidValues):
     }
     invalid_mappings = {
         5: '`5` is not a valid choice.',
-        'abc': '`abc` is not a valid choice.'
+        'abc': '`abc` is not a valid choice.',
+        1.5: '`1.5` is not a valid choice.',
+        True: '`True` is not a valid choice.'
     }
     # This choice field that uses a non-string type for the valid choices.
     base_field = fields.ChoiceField(
@@ -113,7 +115,8 @@ class TestMultipleChoiceField(ValidAndInvalidValues):
     }
     invalid_mappings = {
         'abc': 'Expected a list of items but got type `str`',
-        ('aircon', 'incorrect'): '`incorrect` is not a valid choice.'
+        ('aircon', 'incorrect'): '`incorrect` is not a valid choice.',
+        ('aircon', ('manual',)): '`(\'manual\',)` is not a valid choice.'
     }
     base_field = fields.MultipleChoiceField(
         choices=[
@@ -124,14 +127,43 @@ class TestMultipleChoiceField(ValidAndInvalidValues):
     )
 
 
+class TestMultipleChoiceFieldWithType(ValidAndInvalidValues):
+    valid_mappings = {
+        (1, '2'): set([1, 2]),
+        (1, 3): set([1, 3]),
+    }
+    invalid_mappings = {
+        (1, True): '`True` is not a valid choice.',
+        (1, 4): '`4` is not a valid choice.'
+    }
+    base_field = fields.MultipleChoiceField(choices=[1, 2, 3])
+
+
 class TestIntegerField(ValidAndInvalidValues):
     valid_mappings = {
         '1': 1,
         '0': 0,
         1: 1,
         0: 0,
+        ' 2 ': 2,
     }
     invalid_mappings = {
-        'abc': 'A valid integer is required.'
+        'abc': 'A valid integer is required.',
+        '1.0': 'A valid integer is required.',
+        1.5: 'A valid integer is required.',
+        True: 'A valid integer is required.',
+        None: 'A valid integer is required.',
     }
     base_field = fields.IntegerField()
+
+
+class TestIntegerFieldWithBounds(ValidAndInvalidValues):
+    valid_mappings = {
+        '1': 1,
+        10: 10,
+    }
+    invalid_mappings = {
+        0: 'Ensure this value is greater than or equal to 1.',
+        '11': 'Ensure this value is less than or equal to 10.',
+    }
+    base_field = fields.IntegerField(min_value=1, max_value=10)
@@ -207,3 +207,133 @@ class TestMethodField:
         assert self.serializer.to_primative(obj) == {
             'example_method_field': "<BasicObject 'a': 1>"
         }
+
+    def test_method_is_bound(self):
+        """
+        The method is looked up when the field is bound, and again if the
+        field is rebound.
+        """
+        field = self.serializer.fields['example_method_field']
+        assert field.method == self.serializer.get_example_method_field
+
+        class OtherParent(object):
+            def get_renamed(self, instance):
+                return 'renamed'
+
+        field.bind('renamed', OtherParent(), None)
+        assert field.to_primative(None) == 'renamed'
+
+    def test_shared_plan_uses_instance(self):
+        """
+        A plan shared by the serializer class looks up the methods on the
+        serializer in use, once per serializer.
+        """
+        serializer = type(self.serializer)()
+        plan = serializer.get_plan('plan', serializers.SerializerPlan)
+        assert plan is self.serializer.get_plan('plan', None)
+        steps = plan.get_steps(serializer)
+        assert steps[0][2] == serializer.get_example_method_field
+        assert plan.get_steps(serializer) is steps
+        assert plan.get_steps(self.serializer)[0][2] == self.serializer.get_example_method_field
+
+    def test_missing_method(self):
+        class TestSerializer(serializers.Serializer):
+            missing = fields.MethodField()
+
+        with pytest.raises(AttributeError):
+            TestSerializer().to_primative(serializers.BasicObject())
+
+
+class TestBatchMethodField:
+    def setup(self):
+        calls = self.calls = []
+
+        class TestSerializer(serializers.Serializer):
+            double = fields.MethodField()
+            square = fields.MethodField()
+
+            def get_double(self, instance):
+                calls.append('double')
+                return instance.a * 2
+
+            def get_double_batch(self, instances):
+                calls.append('double_batch')
+                return [instance.a * 2 for instance in instances]
+
+            def get_square_batch(self, instances):
+                calls.append('square_batch')
+                return {instance: instance.a ** 2 for instance in instances}
+
+        class HashableObject(serializers.BasicObject):
+            __hash__ = object.__hash__
+
+        self.serializer = TestSerializer()
+        self.objects = [HashableObject(a=idx) for idx in range(3)]
+
+    def test_batch_method_field(self):
+        """
+        Batch methods are called once when serializing a list.
+        """
+        list_serializer = serializers.ListSerializer(self.objects, child=self.serializer)
+        assert list_serializer.data == [
+            {'double': 0, 'square': 0},
+            {'double': 2, 'square': 1},
+            {'double': 4, 'square': 4},
+        ]
+        assert self.calls == ['double_batch', 'square_batch']
+
+    def test_single_instance(self):
+        """
+        A batch method alone also serializes single instances.
+        """
+        assert self.serializer.to_primative(self.objects[2]) == {
+            'double': 4, 'square': 4
+        }
+        assert self.calls == ['double', 'square_batch']
+
+    def test_wrong_number_of_results(self):
+        class TestSerializer(serializers.Serializer):
+            total = fields.MethodField()
+
+            def get_total_batch(self, instances):
+                return [1]
+
+        list_serializer = serializers.ListSerializer(self.objects, child=TestSerializer())
+        with pytest.raises(AssertionError):
+            list_serializer.data
+
+
+class TestIntegerFieldToNativeMany:
+    def setup(self):
+        self.field = fields.IntegerField(min_value=0, max_value=100)
+
+    def test_integers(self):
+        assert self.field.to_native_many([1, 2, 3]) == [1, 2, 3]
+
+    def test_strings(self):
+        assert self.field.to_native_many(['1', ' 2', '3']) == [1, 2, 3]
+
+    def test_mixed_types(self):
+        assert self.field.to_native_many([1, '2', 3]) == [1, 2, 3]
+
+    def test_empty(self):
+        assert self.field.to_native_many([]) == []
+
+    def test_invalid_string(self):
+        with pytest.raises(fields.ValidationError):
+            self.field.to_native_many(['1', 'x'])
+
+    def test_rejects_bools(self):
+        with pytest.raises(fields.ValidationError):
+            self.field.to_native_many([1, True])
+
+    def test_bounds(self):
+        with pytest.raises(fields.ValidationError):
+            self.field.to_native_many([1, 101])
+        with pytest.raises(fields.ValidationError):
+            self.field.to_native_many(['-1', '1'])
+
+    def test_list_serializer_reports_item_error(self):
+        serializer = serializers.ListSerializer(child=self.field, data=[1, '2', 101])
+        assert not serializer.is_valid()
+        assert serializer.errors == 'Ensure this value is less than or equal to 100.'
@@ -260,3 +260,78 @@ class TestMultipleCheckbox(HTMLFormsBaseCase):
             </div>
         </div>
     """
+
+
+class TestTemplateCache:
+    def setup(self):
+        class TestSerializer(serializers.Serializer):
+            name = fields.CharField()
+            notes = fields.CharField(style={'type': 'textarea'})
+        self.Serializer = TestSerializer
+        self.renderer = renderers.FormRenderer()
+
+    def test_field_templates_are_cached(self):
+        serializer = self.Serializer()
+        first = self.renderer.render(serializer)
+        key = (renderers.FormRenderer, fields.CharField, 'textarea', 'vertical')
+        template, context = renderers.FormRenderer.field_templates[key]
+        assert template.name == 'fields/vertical/textarea.html'
+        assert self.renderer.render(serializer) == first
+
+    def test_style_is_part_of_the_key(self):
+        output = strip(self.renderer.render(self.Serializer()))
+        assert '<input type="text" class="form-control" name="name">' in output
+        assert '<textarea' in output
+
+    def test_precompile_templates(self, tmpdir):
+        bytecode_cache = renderers.env.bytecode_cache
+        try:
+            renderers.precompile_templates(str(tmpdir))
+            assert 'form.html' in renderers.templates
+            assert 'fields/inline/input.html' in renderers.templates
+            assert tmpdir.listdir()
+        finally:
+            renderers.env.bytecode_cache = bytecode_cache
+
+
+class TestCompiledFormTemplate:
+    def setup(self):
+        class TestSerializer(serializers.Serializer):
+            name = fields.CharField(label='Name')
+            count = fields.IntegerField(label='Count')
+        self.Serializer = TestSerializer
+        self.renderer = renderers.FormRenderer()
+
+    def test_cached_per_class(self):
+        first = self.renderer.get_form_template(self.Serializer(), 'vertical')
+        second = self.renderer.get_form_template(self.Serializer(), 'vertical')
+        assert first is second
+
+    def test_cached_per_layout(self):
+        serializer = self.Serializer()
+        vertical = self.renderer.get_form_template(serializer, 'vertical')
+        inline = self.renderer.get_form_template(serializer, 'inline')
+        assert vertical is not inline
+
+    def test_matches_per_field_rendering(self):
+        serializer = self.Serializer(BasicObject(name='example', count=3))
+        output = self.renderer.render(serializer)
+        for field_result in serializer:
+            assert strip(self.renderer.render_field(field_result)) in strip(output)
+
+    def test_modified_fields_recompile(self):
+        serializer = self.Serializer()
+        shared = self.renderer.get_form_template(serializer, 'vertical')
+        serializer.fields['name'].style = {'type': 'textarea'}
+        assert self.renderer.get_form_template(serializer, 'vertical') is not shared
+        assert '<textarea' in self.renderer.render(serializer)
+        assert '<textarea' not in self.renderer.render(self.Serializer())
+
+    def test_overridden_render_field(self):
+        class CustomRenderer(renderers.FormRenderer):
+            def render_field(self, field_result, **options):
+                return '<CUSTOM %s>' % field_result.field.field_name
+
+        output = CustomRenderer().render(self.Serializer())
+        assert '<CUSTOM name>' in output
+        assert '<CUSTOM count>' in output
@@ -1,5 +1,6 @@
 from core_serializers import serializers, fields
-from core_serializers.utils import BasicObject
+from core_serializers.utils import BasicObject, empty
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from werkzeug import MultiDict
 
 
@@ -245,3 +246,400 @@ class TestNestedListOfListsSerializer:
             "booleans": [[True, True], [False, True]]
         }
         assert self.serializer.validate(input_data) == expected_output
+
+
+class TestInstanceChild:
+    """
+    A child declared on the class is cloned for every list serializer
+    instance, and bound to that instance.
+    """
+
+    def setup(self):
+        class ContextField(fields.Field):
+            def to_primative(self, value):
+                return '%s %s' % (self.root.context, value)
+
+        class ChildSerializer(serializers.Serializer):
+            a = ContextField()
+
+        class TestListSerializer(serializers.ListSerializer):
+            child = ChildSerializer()
+
+            def __init__(self, *args, **kwargs):
+                self.context = kwargs.pop('context', None)
+                super(TestListSerializer, self).__init__(*args, **kwargs)
+
+        self.Serializer = TestListSerializer
+
+    def test_child_is_bound_to_instance(self):
+        serializer = self.Serializer()
+        assert serializer.child is not self.Serializer().child
+        assert serializer.child.parent is serializer
+        assert serializer.child.root is serializer
+        assert serializer.child.fields['a'].root is serializer
+
+    def test_child_uses_root_context(self):
+        objects = [BasicObject(a=1), BasicObject(a=2)]
+        serializer = self.Serializer(objects, context='x')
+        assert serializer.data == [{'a': 'x 1'}, {'a': 'x 2'}]
+
+    def test_modified_child_is_not_shared(self):
+        one = self.Serializer(context='x')
+        two = self.Serializer(context='x')
+        one.child.fields['a'].write_only = True
+        objects = [BasicObject(a=1)]
+        assert one.to_primative(objects) == [{}]
+        assert two.to_primative(objects) == [{'a': 'x 1'}]
+
+    def test_nested_child_uses_outer_root(self):
+        class TestSerializer(serializers.Serializer):
+            items = self.Serializer()
+
+            def __init__(self, *args, **kwargs):
+                self.context = kwargs.pop('context', None)
+                super(TestSerializer, self).__init__(*args, **kwargs)
+
+        obj = BasicObject(items=[BasicObject(a=1)])
+        serializer = TestSerializer(obj, context='y')
+        assert serializer.data == {'items': [{'a': 'y 1'}]}
+        child = serializer.fields['items'].child
+        assert child.parent is serializer.fields['items']
+        assert child.root is serializer
+
+
+class TestColumnarListSerializer:
+    """
+    Lists of objects may be serialized one field at a time.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            c = fields.Field()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.IntegerField()
+            b = fields.Field(source='nested.b')
+            nested = NestedSerializer()
+            method = fields.MethodField()
+
+            def get_method(self, instance):
+                return instance.a * 2
+
+        self.Serializer = TestSerializer
+        self.objects = [
+            BasicObject(a=idx, nested=BasicObject(b=idx + 1, c=idx + 2))
+            for idx in range(3)
+        ]
+
+    def test_serialize_many(self):
+        """
+        Serializing column by column gives the same rows as serializing
+        each instance in turn.
+        """
+        serializer = self.Serializer()
+        expected = [serializer.to_primative(obj) for obj in self.objects]
+        assert serializer.to_primative_many(self.objects) == expected
+        assert [list(row.items()) for row in serializer.to_primative_many(self.objects)] == \
+            [list(row.items()) for row in expected]
+
+    def test_overridden_to_primative(self):
+        """
+        A child that overrides `to_primative()` is still used for each item,
+        including when nested in another serializer.
+        """
+        class CustomSerializer(self.Serializer):
+            def to_primative(self, instance):
+                ret = super(CustomSerializer, self).to_primative(instance)
+                ret['extra'] = True
+                return ret
+
+        serializer = serializers.ListSerializer(self.objects, child=CustomSerializer())
+        assert [item['extra'] for item in serializer.data] == [True, True, True]
+
+        class OuterSerializer(serializers.Serializer):
+            custom = CustomSerializer()
+
+        outer = OuterSerializer()
+        rows = outer.to_primative_many([BasicObject(custom=obj) for obj in self.objects])
+        assert [row['custom']['extra'] for row in rows] == [True, True, True]
+
+    def test_overridden_to_primative_columns(self):
+        """
+        A child that overrides `to_primative()` is also used for columns.
+        """
+        class CustomSerializer(self.Serializer):
+            def to_primative(self, instance):
+                ret = super(CustomSerializer, self).to_primative(instance)
+                ret['a'] *= 100
+                ret['extra'] = True
+                return ret
+
+        serializer = serializers.ListSerializer(
+            self.objects, child=CustomSerializer(), columnar=True
+        )
+        rows = serializers.ListSerializer(self.objects, child=CustomSerializer()).data
+        assert serializer.data['a'] == [row['a'] for row in rows] == [0, 100, 200]
+        assert serializer.data['extra'] == [True, True, True]
+        assert list(serializer.data.keys()) == ['a', 'b', 'nested', 'method', 'extra']
+
+        with ThreadPoolExecutor(2) as executor:
+            serializer = serializers.ListSerializer(
+                self.objects, child=CustomSerializer(), columnar=True,
+                executor=executor, chunk_size=2
+            )
+            assert serializer.data['a'] == [0, 100, 200]
+
+    def test_serialize_columns(self):
+        serializer = serializers.ListSerializer(
+            self.objects, child=self.Serializer(), columnar=True
+        )
+        assert serializer.data == {
+            'a': [0, 1, 2],
+            'b': [1, 2, 3],
+            'nested': [{'c': 2}, {'c': 3}, {'c': 4}],
+            'method': [0, 2, 4]
+        }
+
+    def test_serialize_empty(self):
+        serializer = serializers.ListSerializer(
+            [], child=self.Serializer(), columnar=True
+        )
+        assert serializer.data == {'a': [], 'b': [], 'nested': [], 'method': []}
+
+
+class TestStreamingListSerializer:
+    def setup(self):
+        class TestSerializer(serializers.Serializer):
+            integer = fields.IntegerField()
+
+        class ObjectListSerializer(serializers.ListSerializer):
+            child = TestSerializer()
+
+        self.Serializer = ObjectListSerializer
+
+    def test_iter_primative(self):
+        """
+        Items are serialized one at a time from any iterable.
+        """
+        objects = (BasicObject(integer=idx) for idx in range(3))
+        serializer = self.Serializer(objects)
+        output = serializer.iter_primative()
+        assert next(output) == {'integer': 0}
+        assert list(output) == [{'integer': 1}, {'integer': 2}]
+
+
+class TestIterNative:
+    def setup(self):
+        class IntegerListSerializer(serializers.ListSerializer):
+            child = fields.IntegerField()
+        self.serializer = IntegerListSerializer()
+
+    def test_iter_native(self):
+        """
+        Items are validated one at a time, with errors reported by index.
+        """
+        results = self.serializer.iter_native(iter(['1', 'x', '3']))
+        assert list(results) == [
+            serializers.ItemResult(0, 1, None),
+            serializers.ItemResult(1, None, 'A valid integer is required.'),
+            serializers.ItemResult(2, 3, None),
+        ]
+
+    def test_max_errors(self):
+        """
+        Validation stops after `max_errors` invalid items.
+        """
+        def items():
+            yield 'x'
+            yield '2'
+            yield 'y'
+            raise AssertionError('Consumed too many items.')
+
+        results = self.serializer.iter_native(items(), max_errors=2)
+        assert [result.index for result in results] == [0, 1, 2]
+
+
+class TestPartialListSerializer:
+    def setup(self):
+        class TestSerializer(serializers.Serializer):
+            integer = fields.IntegerField()
+
+        class ObjectListSerializer(serializers.ListSerializer):
+            child = TestSerializer()
+            allow_partial = True
+
+        self.Serializer = ObjectListSerializer
+
+    def test_partial_validate(self):
+        """
+        Every item is validated, and the valid items may still be saved.
+        """
+        input_data = [{"integer": "1"}, {"integer": "x"}, {}, {"integer": "4"}]
+        serializer = self.Serializer(data=input_data)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            1: {'integer': 'A valid integer is required.'},
+            2: {'integer': 'This field is required.'},
+        }
+        assert serializer.validated_data == [{"integer": 1}, {"integer": 4}]
+        assert serializer.save() == [BasicObject(integer=1), BasicObject(integer=4)]
+
+    def test_partial_validate_all_valid(self):
+        serializer = self.Serializer(data=[{"integer": "1"}])
+        assert serializer.is_valid()
+        assert serializer.errors == {}
+
+    def test_not_partial(self):
+        serializer = self.Serializer(data=[{"integer": "x"}], allow_partial=False)
+        assert not serializer.is_valid()
+        assert serializer.errors == {'integer': 'A valid integer is required.'}
+        assert serializer.validated_data == {}
+
+
+class IntegerSerializer(serializers.Serializer):
+    integer = fields.IntegerField()
+
+
+class ExecutorListSerializer(serializers.ListSerializer):
+    child = IntegerSerializer()
+    chunk_size = 2
+
+
+class TestExecutorListSerializer:
+    """
+    Lists may be validated in chunks using an executor.
+    """
+
+    def setup(self):
+        self.input_data = [{'integer': str(idx)} for idx in range(7)]
+        self.expected_output = [{'integer': idx} for idx in range(7)]
+
+    def test_validate_with_threads(self):
+        with ThreadPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(data=self.input_data, executor=executor)
+            assert serializer.is_valid()
+        assert serializer.validated_data == self.expected_output
+
+    def test_validate_with_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(data=self.input_data, executor=executor)
+            assert serializer.is_valid()
+        assert serializer.validated_data == self.expected_output
+
+    def test_validate_child_with_processes(self):
+        with ProcessPoolExecutor(2) as executor:
+            serializer = serializers.ListSerializer(
+                data=self.input_data, child=IntegerSerializer(),
+                executor=executor, chunk_size=2
+            )
+            assert serializer.is_valid()
+        assert serializer.validated_data == self.expected_output
+
+    def test_detached_child(self):
+        serializer = serializers.ListSerializer(
+            data=self.input_data, child=IntegerSerializer()
+        )
+        child = serializer.get_detached_child()
+        assert child is not serializer.child
+        assert child.parent is None
+        assert child.root is None
+        assert child.validate({'integer': '1'}) == {'integer': 1}
+
+    def test_first_error(self):
+        self.input_data[3] = {'integer': 'x'}
+        self.input_data[5] = {}
+        with ThreadPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(data=self.input_data, executor=executor)
+            assert not serializer.is_valid()
+        assert serializer.errors == {'integer': 'A valid integer is required.'}
+
+    def test_partial_errors(self):
+        self.input_data[3] = {'integer': 'x'}
+        self.input_data[5] = {}
+        with ThreadPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(
+                data=self.input_data, executor=executor, allow_partial=True
+            )
+            assert not serializer.is_valid()
+        assert serializer.errors == {
+            3: {'integer': 'A valid integer is required.'},
+            5: {'integer': 'This field is required.'},
+        }
+        assert serializer.validated_data == [
+            {'integer': idx} for idx in (0, 1, 2, 4, 6)
+        ]
+
+    def test_serialize_with_threads(self):
+        objects = [BasicObject(integer=idx) for idx in range(7)]
+        with ThreadPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(objects, executor=executor)
+            assert serializer.data == self.expected_output
+            assert list(serializer.iter_primative()) == self.expected_output
+
+    def test_serialize_with_processes(self):
+        objects = [BasicObject(integer=idx) for idx in range(7)]
+        with ProcessPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(objects, executor=executor)
+            assert serializer.data == self.expected_output
+
+    def test_serialize_child_with_processes(self):
+        objects = [BasicObject(integer=idx) for idx in range(7)]
+        with ProcessPoolExecutor(2) as executor:
+            serializer = serializers.ListSerializer(
+                objects, child=IntegerSerializer(), executor=executor, chunk_size=2
+            )
+            assert serializer.data == self.expected_output
+            assert list(serializer.iter_primative()) == self.expected_output
+
+    def test_serialize_columns(self):
+        objects = [BasicObject(integer=idx) for idx in range(7)]
+        with ThreadPoolExecutor(2) as executor:
+            serializer = ExecutorListSerializer(objects, executor=executor, columnar=True)
+            assert serializer.data == {'integer': list(range(7))}
+            serializer = ExecutorListSerializer([], executor=executor, columnar=True)
+            assert serializer.data == {'integer': []}
+
+
+class TestScalarListSerializer:
+    """
+    Lists of scalar values are converted all at once, falling back to
+    validating each item in order to report errors.
+    """
+
+    def test_char_list(self):
+        serializer = serializers.ListSerializer(child=fields.CharField(), data=['a', 1])
+        assert serializer.is_valid()
+        assert serializer.validated_data == ['a', '1']
+
+    def test_invalid_item(self):
+        serializer = serializers.ListSerializer(child=fields.CharField(), data=['a', ''])
+        assert not serializer.is_valid()
+        assert serializer.errors == 'This field may not be blank.'
+
+    def test_partial_errors_by_index(self):
+        serializer = serializers.ListSerializer(
+            child=fields.CharField(), data=['a', '', 'b', ''], allow_partial=True
+        )
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            1: 'This field may not be blank.', 3: 'This field may not be blank.'
+        }
+        assert serializer.validated_data == ['a', 'b']
+
+    def test_subclass_overriding_to_native(self):
+        class UpperCharField(fields.CharField):
+            def to_native(self, data):
+                return super(UpperCharField, self).to_native(data).upper()
+
+        serializer = serializers.ListSerializer(child=UpperCharField(), data=['a', 'b'])
+        assert serializer.is_valid()
+        assert serializer.validated_data == ['A', 'B']
+
+    def test_subclass_overriding_validate(self):
+        class DefaultField(fields.Field):
+            def validate(self, data=empty):
+                return 'default' if data is None else data
+
+        serializer = serializers.ListSerializer(child=DefaultField(), data=['a', None])
+        assert serializer.is_valid()
+        assert serializer.validated_data == ['a', 'default']
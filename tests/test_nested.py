@@ -97,3 +97,33 @@ class TestListSerializer:
         }
         serializer = self.Serializer()
         assert serializer.data == expected_data
+
+
+class TestNestedMultipleChoiceHTML:
+    def setup(self):
+        class InnerSerializer(serializers.Serializer):
+            tags = fields.MultipleChoiceField(choices=['a', 'b', 'c'])
+
+        class MiddleSerializer(serializers.Serializer):
+            inner = InnerSerializer()
+
+        class OuterSerializer(serializers.Serializer):
+            middle = MiddleSerializer()
+            items = serializers.ListSerializer(child=InnerSerializer())
+
+        self.Serializer = OuterSerializer
+
+    def test_validate_html_input(self):
+        input_data = MultiDict([
+            ('middle.inner.tags', 'a'),
+            ('middle.inner.tags', 'c'),
+            ('items[0]tags', 'b'),
+            ('items[0]tags', 'c'),
+            ('items[1]tags', 'a'),
+        ])
+        serializer = self.Serializer(data=input_data)
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == {
+            'middle': {'inner': {'tags': set(['a', 'c'])}},
+            'items': [{'tags': set(['b', 'c'])}, {'tags': set(['a'])}]
+        }
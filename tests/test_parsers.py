@@ -0,0 +1,146 @@
+from core_serializers import fields, parsers, renderers, serializers
+from core_serializers.utils import BasicObject
+import io
+import pytest
+
+
+class TestBinaryRoundTrip:
+    """
+    Serializer data rendered as MessagePack or CBOR parses back into
+    equivalent input data for the serializer.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            name = fields.CharField()
+
+        class TestSerializer(serializers.Serializer):
+            text = fields.CharField()
+            number = fields.IntegerField()
+            flag = fields.BooleanField()
+            choices = fields.MultipleChoiceField(choices=['a', 'b', 'c'])
+            nested = NestedSerializer()
+            items = serializers.ListSerializer(child=fields.IntegerField())
+
+        self.Serializer = TestSerializer
+        self.instance = BasicObject(
+            text=u'caf\xe9', number=-2 ** 40, flag=False, choices=set(['c', 'a']),
+            nested=BasicObject(name='nested'), items=[1, 300, 70000]
+        )
+        self.pairs = []
+        for accelerated in (False, True):
+            for renderer_class, parser_class in (
+                (renderers.MsgPackRenderer, parsers.MsgPackParser),
+                (renderers.CBORRenderer, parsers.CBORParser),
+            ):
+                if accelerated and not renderer_class.accelerated:
+                    continue
+                renderer, parser = renderer_class(), parser_class()
+                renderer.accelerated = parser.accelerated = accelerated
+                self.pairs.append((renderer, parser))
+
+    def test_round_trip(self):
+        data = self.Serializer(self.instance).data
+        for renderer, parser in self.pairs:
+            output = renderer.render(data)
+            assert isinstance(output, bytes)
+            serializer = self.Serializer(data=parser.parse(io.BytesIO(output)))
+            assert serializer.is_valid(), serializer.errors
+            assert serializer.validated_data == {
+                'text': u'caf\xe9', 'number': -2 ** 40, 'flag': False,
+                'choices': set(['a', 'c']), 'nested': {'name': 'nested'},
+                'items': [1, 300, 70000]
+            }
+
+    def test_list_round_trip(self):
+        class TestListSerializer(serializers.ListSerializer):
+            child = self.Serializer()
+
+        data = TestListSerializer([self.instance] * 3).data
+        for renderer, parser in self.pairs:
+            parsed = parser.parse(renderer.render(data))
+            assert len(parsed) == 3
+            assert parsed[0]['nested'] == {'name': 'nested'}
+
+    def test_accelerated_output(self):
+        """
+        The accelerated renderers give the same output as the pure Python ones.
+        """
+        data = self.Serializer(self.instance).data
+        for renderer_class in (renderers.MsgPackRenderer, renderers.CBORRenderer):
+            if not renderer_class.accelerated:
+                continue
+            pure = renderer_class()
+            pure.accelerated = False
+            assert renderer_class().render(data) == pure.render(data)
+
+    def test_invalid(self):
+        for renderer, parser in self.pairs:
+            with pytest.raises(ValueError):
+                parser.parse(renderer.render([1, 2])[:-1])
+
+
+def parse_both(parser_class, data):
+    """
+    Return the result of parsing `data` with the pure Python and the
+    accelerated parser, or `ValueError` for invalid input.
+    """
+    results = []
+    for accelerated in (False, True):
+        parser = parser_class()
+        parser.accelerated = accelerated
+        try:
+            results.append(parser.parse(data))
+        except ValueError:
+            results.append(ValueError)
+    return results
+
+
+class TestAcceleratedParsers:
+    """
+    The accelerated parsers return the same data as the pure Python ones,
+    and reject the same input.
+    """
+
+    @pytest.mark.skipif(parsers.msgpack is None, reason='msgpack is not installed')
+    def test_msgpack(self):
+        for data, expected in (
+            (b'\x81\x01\x02', {1: 2}),                   # integer map key
+            (b'\x81\xc0\x01', {None: 1}),                # nil map key
+            (b'\x81\x92\x01\x02\x03', ValueError),       # array map key
+            (b'\x81\x81\x01\x02\x03', ValueError),       # map map key
+            (b'\xd4\x05\x00', ValueError),               # extension type
+            (b'\x01\x02', ValueError),                   # extra data
+            (b'\x92\x01', ValueError),                   # truncated
+            (b'\xc1', ValueError),                       # unused type
+        ):
+            assert parse_both(parsers.MsgPackParser, data) == [expected, expected], data
+
+    @pytest.mark.skipif(parsers.cbor2 is None, reason='cbor2 is not installed')
+    def test_cbor(self):
+        for data, expected in (
+            ('c074323031332d30332d32315432303a30343a30305a', u'2013-03-21T20:04:00Z'),
+            ('c11a514b67b0', 1363896240),                # epoch date
+            ('d9010283010203', [1, 2, 3]),               # set
+            ('c48221196ab3', [-2, 27315]),               # decimal
+            ('d9ffff0a', 10),                            # unknown tag
+            ('c249010000000000000000', 2 ** 64),         # bignum
+            ('c349010000000000000000', -1 - 2 ** 64),    # negative bignum
+            ('a10102', {1: 2}),                          # integer map key
+            ('a182010201', ValueError),                  # array map key
+            ('a1a1010203', ValueError),                  # map map key
+            ('0102', ValueError),                        # extra data
+            ('0119', ValueError),                        # truncated extra data
+            ('8201', ValueError),                        # truncated
+        ):
+            data = bytes(bytearray.fromhex(data))
+            assert parse_both(parsers.CBORParser, data) == [expected, expected], data
+
+
+class TestJSONParser:
+    def test_parse(self):
+        parser = parsers.JSONParser()
+        assert parser.parse(b'{"a": [1, 2]}') == {'a': [1, 2]}
+        assert parser.parse(io.StringIO(u'"caf\\u00e9"')) == u'caf\xe9'
+        with pytest.raises(ValueError):
+            parser.parse('{')
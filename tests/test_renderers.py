@@ -0,0 +1,490 @@
+from core_serializers import fields, renderers, serializers
+from core_serializers.utils import BasicObject
+from collections import OrderedDict
+import csv
+import io
+import json
+import pytest
+import struct
+
+
+class TestJSONRendererIter:
+    def setup(self):
+        self.renderer = renderers.JSONRenderer()
+        self.data = [{'a': 1, 'b': [1, 2]}, {'a': 'line\nbreak', 'b': []}]
+
+    def test_render_iter(self):
+        """
+        Rendering an iterable in chunks gives the same output as rendering
+        the complete list.
+        """
+        chunks = self.renderer.render_iter(iter(self.data))
+        assert ''.join(chunks) == self.renderer.render(self.data)
+
+    def test_render_iter_indent(self):
+        chunks = self.renderer.render_iter(iter(self.data), indent=4)
+        assert ''.join(chunks) == self.renderer.render(self.data, indent=4)
+
+    def test_render_iter_empty(self):
+        for indent in (None, 4):
+            chunks = self.renderer.render_iter(iter([]), indent=indent)
+            assert ''.join(chunks) == json.dumps([], indent=indent)
+
+    def test_render_iter_is_lazy(self):
+        def items():
+            yield 1
+            raise AssertionError('Consumed too many items.')
+
+        chunks = self.renderer.render_iter(items())
+        assert next(chunks) == '[1'
+
+
+class TestJSONRendererBackends:
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            name = fields.CharField()
+
+        class TestSerializer(serializers.Serializer):
+            text = fields.CharField()
+            number = fields.IntegerField()
+            flag = fields.BooleanField()
+            choice = fields.ChoiceField(choices=[1, 2, 3])
+            choices = fields.MultipleChoiceField(choices=['a', 'b', 'c'])
+            nested = NestedSerializer()
+            items = serializers.ListSerializer(child=fields.IntegerField())
+            method = fields.MethodField()
+            missing = fields.Field()
+
+            def get_method(self, instance):
+                return {'key': 'value', 1: 'integer key'}
+
+        instance = BasicObject(
+            text='caf\xe9 </script>', number=-12, flag=True, choice=2,
+            choices=set(['c', 'a']), nested=BasicObject(name='nested'),
+            items=[1, 2, 3], missing=None
+        )
+        self.data = TestSerializer(instance).data
+        self.expected = json.loads(renderers.JSONRenderer().render(self.data))
+
+    def test_stdlib_encodes_sets_as_lists(self):
+        assert self.expected['choices'] == ['a', 'c']
+        assert self.expected['method'] == {'key': 'value', '1': 'integer key'}
+
+    def test_backends_are_equivalent(self):
+        for backend in renderers.json_backends.keys():
+            for indent in (None, 2, 4):
+                renderer = renderers.JSONRenderer(backend=backend, indent=indent)
+                output = renderer.render(self.data)
+                assert json.loads(output) == self.expected, backend
+                # Integers wider than 64 bits are not supported by every backend.
+                large = {'number': 2 ** 70, 'numbers': [-2 ** 64, 2 ** 64]}
+                assert json.loads(renderer.render(large)) == large, backend
+
+    def test_output_type_does_not_depend_on_indent(self):
+        for backend in renderers.json_backends.keys():
+            types = set(
+                type(renderers.JSONRenderer(backend=backend, indent=indent).render(self.data))
+                for indent in (None, 2, 4)
+            )
+            assert len(types) == 1, backend
+
+    def test_render_iter_uses_backend(self):
+        items = [self.data, {'line': 'a\nb'}]
+        for backend in renderers.json_backends.keys():
+            for indent in (None, 2, 4):
+                renderer = renderers.JSONRenderer(backend=backend, indent=indent)
+                output = renderer.render(items)
+                chunks = list(renderer.render_iter(iter(items)))
+                assert all(type(chunk) is type(output) for chunk in chunks), backend
+                joined = type(output)().join(chunks)
+                assert json.loads(joined) == json.loads(output), backend
+                empty = type(output)().join(renderer.render_iter(iter([])))
+                assert json.loads(empty) == []
+
+    def test_auto_backend(self):
+        renderer = renderers.JSONRenderer(backend='auto')
+        name = [
+            name for name in renderers.auto_json_backends
+            if name in renderers.json_backends
+        ][0]
+        assert renderer.dumps is renderers.json_backends[name]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            renderers.JSONRenderer(backend='unknown')
+
+
+class TestDirectJSONEncoding:
+    """
+    Serializers with instances are encoded straight to JSON, giving the same
+    output as rendering their data.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            name = fields.CharField()
+            label = fields.MethodField()
+
+            def get_label(self, instance):
+                return instance.name.upper()
+
+        class UpperCharField(fields.CharField):
+            def to_primative(self, value):
+                return value.upper()
+
+        class TestSerializer(serializers.Serializer):
+            text = fields.CharField()
+            upper = UpperCharField(source='text')
+            number = fields.IntegerField()
+            ratio = fields.Field()
+            flag = fields.BooleanField()
+            choices = fields.MultipleChoiceField(choices=['a', 'b', 'c'])
+            nested = NestedSerializer()
+            owner = fields.CharField(source='nested.name')
+            children = serializers.ListSerializer(child=NestedSerializer())
+            numbers = serializers.ListSerializer(child=fields.IntegerField())
+            method = fields.MethodField()
+            missing = fields.Field()
+
+            def get_method(self, instance):
+                return {'key': ['value'], 1: None}
+
+        class TestListSerializer(serializers.ListSerializer):
+            child = TestSerializer()
+
+        self.Serializer = TestSerializer
+        self.ListSerializer = TestListSerializer
+        self.instances = [
+            BasicObject(
+                text='caf\xe9 "quoted"\n', number=idx, ratio=idx / 4.0, flag=bool(idx % 2),
+                choices=set(['c', 'a']), nested=BasicObject(name='nested %d' % idx),
+                children=[BasicObject(name='child')] * idx, numbers=list(range(idx)),
+                missing=None
+            )
+            for idx in range(3)
+        ]
+        self.renderer = renderers.JSONRenderer()
+
+    def test_serializer(self):
+        serializer = self.Serializer(self.instances[1])
+        output = self.renderer.render_serializer(serializer)
+        assert output == json.dumps(serializer.data, default=renderers.encode_default)
+
+    def test_list_serializer(self):
+        serializer = self.ListSerializer(self.instances)
+        output = self.renderer.render_serializer(serializer)
+        assert output == self.renderer.render(serializer.data)
+
+    def test_empty_list(self):
+        serializer = self.ListSerializer([])
+        assert self.renderer.render_serializer(serializer) == '[]'
+
+    def test_indent_renders_data(self):
+        serializer = self.ListSerializer(self.instances)
+        output = self.renderer.render_serializer(serializer, indent=4)
+        assert output == self.renderer.render(serializer.data, indent=4)
+
+    def test_batch_methods(self):
+        class BatchSerializer(serializers.Serializer):
+            id = fields.IntegerField()
+            total = fields.MethodField()
+
+            def get_total(self, instance):
+                raise AssertionError('Batch method should be used.')
+
+            def get_total_batch(self, instances):
+                return {instance: instance.id * 10 for instance in instances}
+
+        class HashableObject(BasicObject):
+            __hash__ = object.__hash__
+
+        instances = [HashableObject(id=idx) for idx in range(3)]
+        output = self.renderer.render_instances(BatchSerializer(), instances)
+        assert json.loads(output) == [
+            {'id': 0, 'total': 0}, {'id': 1, 'total': 10}, {'id': 2, 'total': 20}
+        ]
+
+    def test_no_fields(self):
+        assert self.renderer.render_instance(serializers.Serializer(), object()) == '{}'
+
+
+class FakePyArrow:
+    """
+    Stands in for the `pyarrow` module, returning a description of each
+    array instead of building it.
+    """
+
+    class Array:
+        @staticmethod
+        def from_buffers(type, length, buffers, null_count):
+            return (type, length, buffers, null_count)
+
+    class DictionaryArray:
+        @staticmethod
+        def from_arrays(indices, dictionary):
+            return ('dictionary', indices, dictionary)
+
+    class Table:
+        @staticmethod
+        def from_arrays(arrays, names):
+            return list(zip(names, arrays))
+
+    @staticmethod
+    def py_buffer(data):
+        return bytes(data)
+
+    @staticmethod
+    def array(values):
+        return ('array', values)
+
+    int32 = staticmethod(lambda: 'int32')
+    int64 = staticmethod(lambda: 'int64')
+    bool_ = staticmethod(lambda: 'bool')
+    large_string = staticmethod(lambda: 'large_string')
+
+
+class TestColumnarRenderer:
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            name = fields.CharField()
+
+        class TestSerializer(serializers.Serializer):
+            id = fields.IntegerField()
+            active = fields.BooleanField()
+            size = fields.ChoiceField(choices=['small', 'large'])
+            name = fields.CharField()
+            tags = fields.MultipleChoiceField(choices=['a', 'b'])
+            nested = NestedSerializer()
+
+        class TestListSerializer(serializers.ListSerializer):
+            child = TestSerializer()
+
+        self.ListSerializer = TestListSerializer
+        self.instances = [
+            BasicObject(
+                id=1, active=True, size='large', name=u'caf\xe9', tags=set(['a']),
+                nested=BasicObject(name='one')
+            ),
+            BasicObject(
+                id=None, active=None, size=None, name=None, tags=set(),
+                nested=BasicObject(name='two')
+            ),
+            BasicObject(
+                id=-3, active=False, size='small', name='', tags=set(['b']),
+                nested=BasicObject(name='three')
+            ),
+        ]
+        self.renderer = renderers.ColumnarRenderer()
+        serializer = self.ListSerializer()
+        self.columns = self.renderer.get_columns(serializer.child, self.instances)
+
+    def test_column_types(self):
+        assert [(name, column.type) for name, column in self.columns.items()] == [
+            ('id', 'int64'), ('active', 'bool'), ('size', 'dictionary'),
+            ('name', 'string'), ('tags', 'object'), ('nested', 'object')
+        ]
+
+    def test_int64(self):
+        column = self.columns['id']
+        assert column.values.typecode == 'q'
+        assert list(column.values) == [1, 0, -3]
+        assert column.mask == bytearray([1, 0, 1])
+
+    def test_bool(self):
+        column = self.columns['active']
+        assert list(column.values) == [1, 0, 0]
+        assert column.mask == bytearray([1, 0, 1])
+
+    def test_dictionary(self):
+        column = self.columns['size']
+        assert column.dictionary == ['small', 'large']
+        assert list(column.values) == [1, 0, 0]
+        assert column.mask == bytearray([1, 0, 1])
+
+    def test_values_outside_choices(self):
+        field = fields.ChoiceField(choices=['small', 'large'])
+        column = self.renderer.get_column('size', ['small', 'medium'], field)
+        assert column.type == 'object'
+        assert column.values == ['small', 'medium']
+
+        field = fields.ChoiceField(choices=[1, 2])
+        assert self.renderer.get_column('size', [1, True], field).type == 'object'
+        field = fields.ChoiceField(choices=[1, 'two'])
+        assert self.renderer.get_column('size', [1, 'two'], field).type == 'object'
+
+    def test_string(self):
+        column = self.columns['name']
+        assert column.values == u'caf\xe9'.encode('utf-8')
+        assert list(column.offsets) == [0, 5, 5, 5]
+        assert column.mask == bytearray([1, 0, 1])
+
+    def test_objects(self):
+        assert self.columns['nested'].values == [
+            {'name': 'one'}, {'name': 'two'}, {'name': 'three'}
+        ]
+
+    def test_overridden_to_primative(self):
+        class TestSerializer(self.ListSerializer.child.__class__):
+            def to_primative(self, instance):
+                ret = super(TestSerializer, self).to_primative(instance)
+                ret['label'] = '%s (%s)' % (ret.pop('name'), ret.pop('id'))
+                return ret
+
+        columns = self.renderer.get_columns(TestSerializer(), self.instances)
+        assert [(name, column.type) for name, column in columns.items()] == [
+            ('active', 'bool'), ('size', 'dictionary'), ('tags', 'object'),
+            ('nested', 'object'), ('label', 'object')
+        ]
+        assert columns['label'].values == [u'caf\xe9 (1)', 'None (None)', ' (-3)']
+
+    def test_untyped_values(self):
+        column = self.renderer.get_column('id', [1, 'two'], fields.IntegerField())
+        assert column.type == 'object'
+        assert column.values == [1, 'two']
+
+    def test_no_mask_without_nulls(self):
+        column = self.renderer.get_column('id', [1, 2], fields.IntegerField())
+        assert column.mask is None
+
+    def test_pack_bits(self):
+        assert renderers.pack_bits([1, 0, 1, 1, 0, 0, 0, 0, 1]) == b'\x0d\x01'
+
+    @pytest.mark.skipif(renderers.pyarrow is None, reason='pyarrow is not installed')
+    def test_arrow_ipc(self):
+        output = self.renderer.render_serializer(self.ListSerializer(self.instances))
+        table = renderers.pyarrow.ipc.open_file(renderers.pyarrow.py_buffer(output)).read_all()
+        assert table.column('id').to_pylist() == [1, None, -3]
+        assert table.column('size').to_pylist() == ['large', None, 'small']
+        assert table.column('name').to_pylist() == [u'caf\xe9', None, '']
+
+    def test_arrow_buffers(self):
+        """
+        The Arrow arrays are built straight from the column buffers.
+        """
+        pyarrow = renderers.pyarrow
+        renderers.pyarrow = FakePyArrow
+        try:
+            table = dict(self.renderer.get_table(self.columns, 3))
+        finally:
+            renderers.pyarrow = pyarrow
+
+        validity = b'\x05'
+        assert table['id'] == ('int64', 3, [validity, struct.pack('<3q', 1, 0, -3)], 1)
+        assert table['active'] == ('bool', 3, [validity, b'\x01'], 1)
+        assert table['size'] == (
+            'dictionary', ('int32', 3, [validity, struct.pack('<3i', 1, 0, 0)], 1),
+            ('array', ['small', 'large'])
+        )
+        assert table['name'] == (
+            'large_string', 3,
+            [validity, struct.pack('<4q', 0, 5, 5, 5), u'caf\xe9'.encode('utf-8')], 1
+        )
+        assert table['tags'] == ('array', [['a'], [], ['b']])
+        assert table['nested'] == ('array', [{'name': 'one'}, {'name': 'two'}, {'name': 'three'}])
+
+    def test_arrow_buffers_without_nulls(self):
+        column = self.renderer.get_column('id', [1, 2], fields.IntegerField())
+        pyarrow = renderers.pyarrow
+        renderers.pyarrow = FakePyArrow
+        try:
+            array = self.renderer.get_arrow_array(column, 2)
+        finally:
+            renderers.pyarrow = pyarrow
+        assert array == ('int64', 2, [None, struct.pack('<2q', 1, 2)], 0)
+
+    @pytest.mark.skipif(renderers.pyarrow is not None, reason='pyarrow is installed')
+    def test_requires_pyarrow(self):
+        with pytest.raises(ImportError):
+            self.renderer.render_serializer(self.ListSerializer(self.instances))
+
+
+class TestCSVRenderer:
+    def setup(self):
+        class OwnerSerializer(serializers.Serializer):
+            name = fields.CharField()
+            email_address = fields.CharField(source='email')
+
+        class TestSerializer(serializers.Serializer):
+            id = fields.IntegerField(label='ID')
+            title = fields.CharField()
+            owner = OwnerSerializer()
+            tags = fields.MultipleChoiceField(choices=['a', 'b'])
+            total = fields.MethodField()
+            secret = fields.CharField(write_only=True)
+
+            def get_total(self, instance):
+                return instance.id * 10
+
+        self.Serializer = TestSerializer
+        self.instances = [
+            BasicObject(
+                id=idx, title='row, "%d"' % idx, tags=set(['a']),
+                owner=BasicObject(name='owner %d' % idx, email='%d@example.com' % idx)
+            )
+            for idx in range(5)
+        ]
+        self.renderer = renderers.CSVRenderer(chunk_size=2)
+
+    def test_headers(self):
+        assert self.renderer.get_headers(self.Serializer()) == [
+            'ID', 'Title', 'Owner Name', 'Owner Email address', 'Tags', 'Total'
+        ]
+
+    def test_render(self):
+        class TestListSerializer(serializers.ListSerializer):
+            child = self.Serializer()
+
+        output = self.renderer.render_serializer(TestListSerializer(self.instances))
+        rows = list(csv.reader(io.StringIO(output)))
+        assert rows[0] == ['ID', 'Title', 'Owner Name', 'Owner Email address', 'Tags', 'Total']
+        assert rows[1] == ['0', 'row, "0"', 'owner 0', '0@example.com', '["a"]', '0']
+        assert len(rows) == 6
+
+    def test_overridden_to_primative(self):
+        class TestSerializer(self.Serializer):
+            def to_primative(self, instance):
+                ret = super(TestSerializer, self).to_primative(instance)
+                del ret['total']
+                ret['note'] = 'note %d' % instance.id
+                return ret
+
+        class TestListSerializer(serializers.ListSerializer):
+            child = TestSerializer()
+
+        output = self.renderer.render_serializer(TestListSerializer(self.instances))
+        rows = list(csv.reader(io.StringIO(output)))
+        assert rows[0] == ['ID', 'Title', 'Owner Name', 'Owner Email address', 'Tags', 'note']
+        assert rows[1] == ['0', 'row, "0"', 'owner 0', '0@example.com', '["a"]', 'note 0']
+        assert rows[5][-1] == 'note 4'
+        assert len(rows) == 6
+
+    def test_render_iter_is_chunked_and_lazy(self):
+        def instances():
+            for instance in self.instances[:4]:
+                yield instance
+            raise AssertionError('Consumed too many instances.')
+
+        chunks = self.renderer.render_iter(self.Serializer, instances())
+        header, first, second = next(chunks), next(chunks), next(chunks)
+        assert header.count('\n') == 1
+        assert first.count('\n') == 2
+        assert second.startswith('2,')
+
+    def test_render_to(self):
+        class Stream(io.StringIO):
+            flushes = 0
+
+            def flush(self):
+                self.flushes += 1
+
+        stream = Stream()
+        self.renderer.render_to(stream, self.Serializer, self.instances)
+        assert stream.getvalue() == ''.join(
+            renderers.CSVRenderer().render_iter(self.Serializer, self.instances)
+        )
+        assert stream.flushes == 4
+
+    def test_no_header(self):
+        renderer = renderers.CSVRenderer(header=False)
+        output = ''.join(renderer.render_iter(self.Serializer, self.instances[:1]))
+        assert output.startswith('0,')
@@ -1,4 +1,5 @@
 from core_serializers import fields, serializers
+from core_serializers.utils import HTMLDictView, empty
 
 
 class TestSerializer:
@@ -165,3 +166,376 @@ class TestStarredSource:
         obj = serializers.BasicObject(a=1, b=2, c=3, d=4)
         serializer = self.Serializer(obj)
         assert serializer.data == self.data
+
+
+class TestSerializationPlan:
+    """
+    Tests for the compiled plan that is used by `Serializer.to_primative`.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            c = fields.Field()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.Field()
+            b = fields.IntegerField(source='nested.b')
+            hidden = fields.Field(write_only=True)
+            nested = NestedSerializer(source='*')
+            method = fields.MethodField()
+
+            def get_method(self, instance):
+                return instance.a * 2
+
+        self.Serializer = TestSerializer
+
+    def test_serialize(self):
+        """
+        The compiled plan handles dotted, starred and method sources.
+        """
+        obj = serializers.BasicObject(
+            a=1, c=3, hidden=4, nested=serializers.BasicObject(b=2)
+        )
+        serializer = self.Serializer(obj)
+        assert list(serializer.data.items()) == [
+            ('a', 1), ('b', 2), ('nested', {'c': 3}), ('method', 2)
+        ]
+
+    def test_plan_is_reused(self):
+        """
+        The plan is only compiled once for a set of fields.
+        """
+        serializer = self.Serializer()
+        build = serializer.fields.cached
+        assert build('plan', serializers.SerializerPlan) is build('plan', None)
+
+    def test_modified_fields(self):
+        """
+        Modifying the fields after serializing discards the compiled plan.
+        """
+        obj = serializers.BasicObject(
+            a=1, c=3, hidden=4, nested=serializers.BasicObject(b=2)
+        )
+        serializer = self.Serializer()
+        assert 'a' in serializer.to_primative(obj)
+        del serializer.fields['a']
+        assert 'a' not in serializer.to_primative(obj)
+        serializer.fields['hidden'].write_only = False
+        assert serializer.to_primative(obj)['hidden'] == 4
+
+
+class TestValidationPlan:
+    """
+    Tests for the compiled plan that is used by `Serializer.to_native`.
+    """
+
+    def setup(self):
+        class UpperField(fields.Field):
+            def get_value(self, dictionary):
+                return dictionary.get(self.field_name, '').upper()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.IntegerField()
+            b = fields.IntegerField(source='nested.b')
+            upper = UpperField()
+            flag = fields.BooleanField()
+            ignored = fields.Field(read_only=True)
+
+        self.Serializer = TestSerializer
+
+    def test_validate(self):
+        """
+        Flat, dotted and custom `get_value` fields are all validated.
+        """
+        data = {'a': '1', 'b': '2', 'upper': 'abc', 'flag': 'true', 'ignored': 0}
+        serializer = self.Serializer(data=data)
+        assert serializer.is_valid()
+        assert serializer.validated_data == {
+            'a': 1, 'nested': {'b': 2}, 'upper': 'ABC', 'flag': True
+        }
+
+    def test_validate_html_input(self):
+        """
+        HTML input still uses each field's own `get_value`.
+        """
+        class HTMLDict(dict):
+            getlist = None
+
+        data = HTMLDict({'a': '1', 'b': '2', 'upper': 'abc'})
+        serializer = self.Serializer(data=data)
+        assert serializer.is_valid()
+        assert serializer.validated_data['flag'] is False
+
+    def test_html_input_for_custom_get_value(self):
+        """
+        Fields that override `get_value` are given the HTML input as it is,
+        while nested serializers read it through an indexed view.
+        """
+        class HTMLDict(dict):
+            getlist = None
+
+        received = []
+
+        class RecordingField(fields.Field):
+            def get_value(self, dictionary):
+                received.append(dictionary)
+                return dictionary.get(self.field_name, empty)
+
+        class NestedSerializer(serializers.Serializer):
+            b = fields.IntegerField()
+
+        class TestSerializer(serializers.Serializer):
+            a = RecordingField()
+            nested = NestedSerializer()
+
+        data = HTMLDict({'a': '1', 'nested.b': '2'})
+        serializer = TestSerializer(data=data)
+        assert serializer.is_valid()
+        assert serializer.validated_data == {'a': '1', 'nested': {'b': 2}}
+        assert received == [data]
+        assert received[0] is data
+
+        del received[:]
+        serializer = TestSerializer(data=data)
+        assert serializer.data['nested'] == {'b': '2'}
+        assert received[0] is data
+        assert isinstance(serializer.data['nested'], HTMLDictView)
+        assert serializer.data['nested'].source is data
+
+    def test_invalid_values(self):
+        data = {'a': 'x', 'upper': 'abc', 'flag': 'true'}
+        serializer = self.Serializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            'a': 'A valid integer is required.',
+            'b': 'This field is required.'
+        }
+
+
+class TestInstanceFields:
+    """
+    Serializer instances get their own fields, bound to the instance, the
+    first time that they are used.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            c = fields.Field()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.Field()
+            nested = NestedSerializer()
+            method = fields.MethodField()
+
+            def __init__(self, *args, **kwargs):
+                self.multiplier = kwargs.pop('multiplier', 1)
+                super(TestSerializer, self).__init__(*args, **kwargs)
+
+            def get_method(self, instance):
+                return instance.a * self.multiplier
+
+        self.Serializer = TestSerializer
+
+    def test_fields_are_bound_to_instance(self):
+        serializer = self.Serializer()
+        assert serializer.fields['a'].parent is serializer
+        assert serializer.fields['a'].root is serializer
+        nested = serializer.fields['nested']
+        assert nested.fields['c'].parent is nested
+        assert nested.fields['c'].root is serializer
+
+    def test_modified_fields_are_not_shared(self):
+        one = self.Serializer()
+        two = self.Serializer()
+        one.fields['a'].write_only = True
+        assert not two.fields['a'].write_only
+
+        obj = serializers.BasicObject(a=1, nested=serializers.BasicObject(c=2))
+        assert 'a' not in one.to_primative(obj)
+        assert 'a' in two.to_primative(obj)
+
+    def test_fields_modified_through_values(self):
+        one = self.Serializer()
+        two = self.Serializer()
+        obj = serializers.BasicObject(a=1, nested=serializers.BasicObject(c=2))
+        assert 'a' in one.to_primative(obj)
+        for field in one.fields.values():
+            field.write_only = True
+        assert one.to_primative(obj) == {}
+        assert 'a' in two.to_primative(obj)
+
+    def test_method_fields_use_instance(self):
+        obj = serializers.BasicObject(a=1, nested=serializers.BasicObject(c=2))
+        assert self.Serializer(obj).data['method'] == 1
+        assert self.Serializer(obj, multiplier=3).data['method'] == 3
+
+    def test_custom_field_uses_parent(self):
+        class ScaledField(fields.Field):
+            def to_primative(self, value):
+                return value * self.parent.scale
+
+        class ScaledSerializer(serializers.Serializer):
+            a = ScaledField()
+
+            def __init__(self, *args, **kwargs):
+                self.scale = kwargs.pop('scale')
+                super(ScaledSerializer, self).__init__(*args, **kwargs)
+
+        obj = serializers.BasicObject(a=2)
+        assert ScaledSerializer(obj, scale=3).data == {'a': 6}
+        assert ScaledSerializer(obj, scale=5).data == {'a': 10}
+
+    def test_nested_fields_use_outer_root(self):
+        class ContextField(fields.Field):
+            def to_primative(self, value):
+                return self.root.context
+
+        class NestedSerializer(serializers.Serializer):
+            c = ContextField()
+
+        class OuterSerializer(serializers.Serializer):
+            nested = NestedSerializer()
+
+            def __init__(self, *args, **kwargs):
+                self.context = kwargs.pop('context')
+                super(OuterSerializer, self).__init__(*args, **kwargs)
+
+        obj = serializers.BasicObject(nested=serializers.BasicObject(c=1))
+        assert OuterSerializer(obj, context='example').data == {
+            'nested': {'c': 'example'}
+        }
+
+
+class TestSharedPlans:
+    """
+    Serializers that have not cloned their fields use the plans compiled
+    from the fields shared by their class.
+    """
+
+    def setup(self):
+        class NestedSerializer(serializers.Serializer):
+            c = fields.IntegerField()
+
+        class TestSerializer(serializers.Serializer):
+            a = fields.IntegerField()
+            nested = NestedSerializer()
+            method = fields.MethodField()
+
+            def __init__(self, *args, **kwargs):
+                self.multiplier = kwargs.pop('multiplier', 1)
+                super(TestSerializer, self).__init__(*args, **kwargs)
+
+            def get_method(self, instance):
+                return instance.a * self.multiplier
+
+        self.Serializer = TestSerializer
+        self.obj = serializers.BasicObject(a=1, nested=serializers.BasicObject(c=2))
+
+    def test_plans_are_shared(self):
+        one = self.Serializer(self.obj)
+        two = self.Serializer(self.obj, multiplier=3)
+        assert one.data == {'a': 1, 'nested': {'c': 2}, 'method': 1}
+        assert two.data == {'a': 1, 'nested': {'c': 2}, 'method': 3}
+        assert not one.fields.is_cloned()
+        assert one.get_plan('plan', None) is two.get_plan('plan', None)
+
+    def test_cloned_fields_are_not_shared(self):
+        one = self.Serializer(self.obj)
+        two = self.Serializer(self.obj)
+        one.fields['a'].write_only = True
+        assert one.data == {'nested': {'c': 2}, 'method': 1}
+        assert two.data == {'a': 1, 'nested': {'c': 2}, 'method': 1}
+        assert one.get_plan('plan', None) is not two.get_plan('plan', None)
+
+    def test_reading_field_names_does_not_clone(self):
+        serializer = self.Serializer(self.obj)
+        assert list(serializer.fields.keys()) == ['a', 'nested', 'method']
+        assert list(serializer.fields) == ['a', 'nested', 'method']
+        assert 'a' in serializer.fields
+        assert len(serializer.fields) == 3
+        assert not serializer.fields.is_cloned()
+        serializer.fields['a']
+        assert serializer.fields.is_cloned()
+
+    def test_field_looked_up_again_discards_plan(self):
+        serializer = self.Serializer()
+        field = serializer.fields['a']
+        assert 'a' in serializer.to_primative(self.obj)
+        field.write_only = True
+        serializer.fields['a']
+        assert 'a' not in serializer.to_primative(self.obj)
+
+    def test_custom_fields_are_not_shared(self):
+        class ScaledField(fields.IntegerField):
+            def to_primative(self, value):
+                return value * self.parent.scale
+
+        class ScaledSerializer(serializers.Serializer):
+            a = ScaledField()
+
+        assert self.Serializer.get_shared_fields() is not None
+        assert ScaledSerializer.get_shared_fields() is None
+
+    def test_nested_method_fields_are_not_shared(self):
+        class NestedSerializer(serializers.Serializer):
+            c = fields.MethodField()
+
+            def get_c(self, instance):
+                return self.root.context
+
+        class OuterSerializer(serializers.Serializer):
+            nested = NestedSerializer()
+
+            def __init__(self, *args, **kwargs):
+                self.context = kwargs.pop('context')
+                super(OuterSerializer, self).__init__(*args, **kwargs)
+
+        assert NestedSerializer.get_shared_fields() is not None
+        assert OuterSerializer.get_shared_fields() is None
+        obj = serializers.BasicObject(nested=serializers.BasicObject())
+        assert OuterSerializer(obj, context='one').data == {'nested': {'c': 'one'}}
+        assert OuterSerializer(obj, context='two').data == {'nested': {'c': 'two'}}
+
+    def test_validate(self):
+        serializer = self.Serializer(data={'a': '1', 'nested': {'c': '2'}})
+        assert serializer.is_valid()
+        assert serializer.validated_data == {'a': 1, 'nested': {'c': 2}}
+        assert not serializer.fields.is_cloned()
+
+
+class TestFieldResults:
+    def setup(self):
+        class TestSerializer(serializers.Serializer):
+            a = fields.IntegerField()
+            b = fields.CharField()
+        self.Serializer = TestSerializer
+
+    def test_unbound(self):
+        serializer = self.Serializer()
+        results = list(serializer)
+        assert [result.field.field_name for result in results] == ['a', 'b']
+        assert [result.error for result in results] == [None, None]
+
+    def test_invalid_data(self):
+        serializer = self.Serializer(data={'a': 'abc', 'b': 'example'})
+        assert not serializer.is_valid()
+        results = list(serializer)
+        assert [result.value for result in results] == ['abc', 'example']
+        assert results[0].error == 'A valid integer is required.'
+        assert results[1].error is None
+
+    def test_errors_before_is_valid(self):
+        serializer = self.Serializer(data={'a': '1', 'b': 'example'})
+        assert [result.error for result in serializer] == [None, None]
+
+    def test_iter_many(self):
+        forms = [
+            self.Serializer(data={'a': str(idx), 'b': 'row %d' % idx})
+            for idx in range(3)
+        ]
+        for form in forms:
+            form.is_valid()
+        results = list(serializers.Serializer.iter_many(forms))
+        assert [[result.value for result in row] for row in results] == [
+            ['0', 'row 0'], ['1', 'row 1'], ['2', 'row 2']
+        ]
@@ -0,0 +1,160 @@
+from core_serializers.utils import (
+    HTMLDictView, get_html_index, get_html_view, iter_json_array,
+    parse_html_dict, parse_html_list
+)
+from werkzeug.datastructures import MultiDict
+import io
+import json
+import pytest
+
+
+class TestIterJSONArray:
+    data = [1, -2.5, 'a "quoted" string', u'caf\xe9', [1, [2]], {'a': None}, True]
+
+    def test_parse(self):
+        """
+        Items are parsed correctly however the input is split into chunks.
+        """
+        text = json.dumps(self.data, indent=2)
+        for chunk_size in (1, 2, 3, 7, 65536):
+            stream = io.StringIO(text)
+            assert list(iter_json_array(stream, chunk_size)) == self.data
+
+    def test_parse_bytes(self):
+        content = json.dumps(self.data, ensure_ascii=False).encode('utf-8')
+        for chunk_size in (1, 5, 65536):
+            stream = io.BytesIO(content)
+            assert list(iter_json_array(stream, chunk_size)) == self.data
+
+    def test_parse_empty(self):
+        assert list(iter_json_array(io.StringIO(' [ ] '))) == []
+
+    def test_parse_is_lazy(self):
+        stream = io.StringIO('[1, 2, !')
+        items = iter_json_array(stream, chunk_size=4)
+        assert next(items) == 1
+        assert next(items) == 2
+        with pytest.raises(ValueError):
+            next(items)
+
+    def test_invalid(self):
+        for text in ('', '{}', '[1 2]', '[1, 2'):
+            with pytest.raises(ValueError):
+                list(iter_json_array(io.StringIO(text), chunk_size=2))
+
+    def test_invalid_item_fails_fast(self):
+        """
+        Invalid items raise straight away, rather than reading the rest of
+        the stream in case the item continues.
+        """
+        class CountingStream(io.StringIO):
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                return super(CountingStream, self).read(size)
+
+        for item in ('x', '{"a" 1}', '1x', '"\\q"'):
+            stream = CountingStream('[1, %s, %s]' % (item, ', '.join(['2'] * 10000)))
+            with pytest.raises(ValueError):
+                list(iter_json_array(stream, chunk_size=64))
+            assert stream.reads <= 2
+
+    def test_items_split_across_chunks(self):
+        data = [u'caf\xe9 ' * 20, -12345.5e10, float('-inf'), {'a': [True, None]}]
+        text = json.dumps(data)
+        for chunk_size in range(1, 12):
+            assert list(iter_json_array(io.StringIO(text), chunk_size)) == data
+
+
+class TestHTMLIndex:
+    def setup(self):
+        self.data = MultiDict([
+            ('profile.name', 'example'),
+            ('profile.address.city', 'London'),
+            ('items[1]name', 'two'),
+            ('items[0]name', 'one'),
+            ('items.other', 'x'),
+            ('tags[0]', 'a'),
+            ('tags[1]', 'b'),
+            ('tags[x]', 'c'),
+            ('profiles', 'none'),
+            ('[0]', 'top'),
+        ])
+
+    def test_index(self):
+        index = get_html_index(self.data)
+        assert index['profile'] == [
+            ('profile.name', '.name'), ('profile.address.city', '.address.city')
+        ]
+        assert index['profiles'] == [('profiles', '')]
+        assert index[''] == [('[0]', '[0]')]
+
+    def test_view_index_is_reused(self):
+        view = get_html_view(self.data)
+        assert view.source is self.data
+        assert get_html_view(view) is view
+        assert get_html_index(view) is get_html_index(view)
+        assert parse_html_dict(view, 'profile') == parse_html_dict(self.data, 'profile')
+        nested = parse_html_dict(view, 'profile')
+        assert get_html_index(nested) is get_html_index(nested)
+
+    def test_mutable_index_is_rebuilt(self):
+        assert get_html_index(self.data) is not get_html_index(self.data)
+
+    def test_keys_replaced(self):
+        """
+        Replacing one key with another, keeping the same number of keys,
+        is seen by the next lookup.
+        """
+        assert parse_html_dict(self.data, 'profile')['name'] == 'example'
+        del self.data['profile.name']
+        self.data['profile.email'] = 'example@example.com'
+        profile = parse_html_dict(self.data, 'profile')
+        assert 'name' not in profile
+        assert profile['email'] == 'example@example.com'
+
+    def test_parse_html_dict(self):
+        assert parse_html_dict(self.data, 'profile') == {
+            'name': 'example', 'address.city': 'London'
+        }
+        assert parse_html_dict(self.data, 'profile.address') == {'city': 'London'}
+        assert parse_html_dict(self.data, 'missing') == {}
+
+    def test_parse_html_list(self):
+        assert parse_html_list(self.data, 'tags') == ['a', 'b']
+        assert parse_html_list(self.data) == ['top']
+        items = parse_html_list(self.data, 'items')
+        assert [dict(item) for item in items] == [{'name': 'one'}, {'name': 'two'}]
+
+
+class TestHTMLDictView:
+    def setup(self):
+        self.data = MultiDict([
+            ('profile.name', 'example'),
+            ('profile.tags', 'a'),
+            ('profile.tags', 'b'),
+            ('profile.address.city', 'London'),
+            ('items[0]tags', 'c'),
+            ('items[0]tags', 'd'),
+        ])
+
+    def test_dict_view(self):
+        view = parse_html_dict(self.data, 'profile')
+        assert isinstance(view, HTMLDictView)
+        assert view['tags'] == 'a'
+        assert view.getlist('tags') == ['a', 'b']
+        assert view.getlist('missing') == []
+        assert view.get('missing') is None
+        assert 'name' in view
+        assert len(view) == 3
+
+    def test_list_view(self):
+        view = parse_html_list(self.data, 'items')[0]
+        assert view.getlist('tags') == ['c', 'd']
+
+    def test_view_of_view_reads_from_source(self):
+        view = parse_html_dict(parse_html_dict(self.data, 'profile'), 'address')
+        assert view.source is self.data
+        assert view.keys_map == {'city': 'profile.address.city'}
+        assert view == {'city': 'London'}